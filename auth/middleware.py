@@ -2,10 +2,16 @@
 Authentication middleware for password-protected dashboard access.
 """
 
+import asyncio
+import html
 import os
+import string
 import secrets
 import hashlib
-from datetime import datetime, timedelta
+import functools
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Callable
 import structlog
 
@@ -18,12 +24,129 @@ logger = structlog.get_logger()
 SESSION_COOKIE_NAME = "spotify_trends_session"
 SESSION_DURATION_HOURS = 24
 
+# Session cache bounds
+SESSION_CACHE_MAX_SIZE = 10_000
+SESSION_CACHE_SWEEP_INTERVAL = 100  # Inserts between expiry sweeps
+SESSION_CACHE_PURGE_SECONDS = 300  # Background full-purge period
+NEGATIVE_SESSION_CACHE_MAX_SIZE = 1_000
+NEGATIVE_SESSION_CACHE_TTL_SECONDS = 30
+
+
+def expiry_timestamp(expires_at: datetime) -> float:
+    """Convert a session expiry (naive datetimes are UTC) to a unix timestamp."""
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp()
+
+
+class SessionCache:
+    """
+    Bounded LRU + TTL cache of validated session IDs.
+
+    Callers pass expiries as unix timestamps; they are stored as
+    ``time.monotonic()`` deadlines so the hot-path check is a single float
+    comparison that is unaffected by wall-clock adjustments.
+
+    Entries are kept in recency order so the least recently used entry
+    can be evicted in O(1) once ``max_size`` is reached. Expired entries
+    are dropped on lookup and by a periodic sweep of the oldest entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int = SESSION_CACHE_MAX_SIZE,
+        sweep_interval: int = SESSION_CACHE_SWEEP_INTERVAL,
+    ):
+        self.max_size = max_size
+        self.sweep_interval = sweep_interval
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._inserts_since_sweep = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    def get(self, session_id: str) -> Optional[float]:
+        """Return the session's monotonic deadline if cached and unexpired."""
+        deadline = self._entries.get(session_id)
+        if deadline is None:
+            return None
+        if deadline <= time.monotonic():
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return deadline
+
+    def set(self, session_id: str, expires_at: float) -> None:
+        """Cache a session, evicting the least recently used entry if full."""
+        if session_id in self._entries:
+            self._entries.move_to_end(session_id)
+        elif len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+        self._entries[session_id] = time.monotonic() + (expires_at - time.time())
+
+        self._inserts_since_sweep += 1
+        if self._inserts_since_sweep >= self.sweep_interval:
+            self.sweep()
+
+    def discard(self, session_id: str) -> None:
+        """Remove a session from the cache if present."""
+        self._entries.pop(session_id, None)
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry, wherever it sits in the cache."""
+        now = time.monotonic()
+        expired = [sid for sid, deadline in self._entries.items() if deadline <= now]
+        for session_id in expired:
+            del self._entries[session_id]
+        return len(expired)
+
+    def sweep(self) -> int:
+        """
+        Drop expired entries from the oldest end of the cache.
+
+        All sessions share the same TTL, so insertion order roughly tracks
+        expiry order and the scan can stop at the first live entry.
+        """
+        self._inserts_since_sweep = 0
+        now = time.monotonic()
+        removed = 0
+        while self._entries:
+            _, deadline = next(iter(self._entries.items()))
+            if deadline > now:
+                break
+            self._entries.popitem(last=False)
+            removed += 1
+        return removed
+
+
 # In-memory session cache (backed by database)
-_session_cache: dict = {}
+_session_cache = SessionCache()
+
+# Recently rejected session IDs, so stale cookies don't hit the database
+_session_negcache = SessionCache(max_size=NEGATIVE_SESSION_CACHE_MAX_SIZE)
+
+
+async def purge_session_caches(interval: float = SESSION_CACHE_PURGE_SECONDS) -> None:
+    """Periodically drop expired entries from the in-memory session caches."""
+    while True:
+        await asyncio.sleep(interval)
+        removed = _session_cache.purge_expired() + _session_negcache.purge_expired()
+        if removed:
+            logger.debug("session_cache_purged", removed=removed)
 
 
+@functools.lru_cache(maxsize=1)
 def get_auth_password() -> Optional[str]:
-    """Get the AUTH_PASSWORD from environment."""
+    """
+    Get the AUTH_PASSWORD from environment.
+
+    The lookup is cached; create_app clears the cache so the app is
+    configured from the environment at the time it is built. Call
+    ``get_auth_password.cache_clear()`` after changing it elsewhere.
+    """
     return os.environ.get("AUTH_PASSWORD")
 
 
@@ -51,22 +174,21 @@ def is_auth_enabled() -> bool:
     return bool(get_auth_password())
 
 
-# Public paths that don't require authentication
-PUBLIC_PATHS = {
+# Public paths that don't require authentication: exact paths are a single
+# set lookup, prefixes are checked together by str.startswith
+PUBLIC_EXACT_PATHS = frozenset({
     "/health",
     "/api/health",
     "/auth/login",
     "/auth/logout",
     "/static",
-}
+})
+PUBLIC_PATH_PREFIXES = ("/static/",)
 
 
 def is_public_path(path: str) -> bool:
     """Check if path is public (no auth required)."""
-    for public in PUBLIC_PATHS:
-        if path.startswith(public):
-            return True
-    return False
+    return path in PUBLIC_EXACT_PATHS or path.startswith(PUBLIC_PATH_PREFIXES)
 
 
 class AuthMiddleware(BaseHTTPMiddleware):
@@ -74,17 +196,18 @@ class AuthMiddleware(BaseHTTPMiddleware):
     Middleware to protect dashboard with password authentication.
 
     - All /api/* and / endpoints require authentication
-    - /health and /auth/* are public
+    - /health, /auth/login, /auth/logout and /static/* are public
     - Session stored in cookie after successful login
     """
 
     def __init__(self, app, storage_getter: Callable = None):
         super().__init__(app)
         self.storage_getter = storage_getter
+        self.enabled = is_auth_enabled()
 
     async def dispatch(self, request: Request, call_next) -> Response:
         # Skip auth if not enabled
-        if not is_auth_enabled():
+        if not self.enabled:
             return await call_next(request)
 
         path = request.url.path
@@ -118,13 +241,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
     async def _validate_session(self, request: Request, session_id: str) -> bool:
         """Validate session from cache or database."""
         # Check cache first
-        if session_id in _session_cache:
-            cached = _session_cache[session_id]
-            if cached["expires_at"] > datetime.utcnow():
-                return True
-            else:
-                del _session_cache[session_id]
-                return False
+        if _session_cache.get(session_id) is not None:
+            return True
+
+        # Skip the database for recently rejected sessions
+        if _session_negcache.get(session_id) is not None:
+            return False
 
         # Check database if storage available
         if self.storage_getter:
@@ -134,23 +256,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
                     from storage.base import UserSession
                     session = await storage.get_user_session(session_id)
                     if session and session.is_valid:
-                        if session.expires_at and session.expires_at > datetime.utcnow():
+                        expires_at = (
+                            expiry_timestamp(session.expires_at)
+                            if session.expires_at else 0.0
+                        )
+                        if expires_at > time.time():
                             # Cache it
-                            _session_cache[session_id] = {
-                                "expires_at": session.expires_at
-                            }
+                            _session_cache.set(session_id, expires_at)
                             return True
+
+                    _session_negcache.set(
+                        session_id, time.time() + NEGATIVE_SESSION_CACHE_TTL_SECONDS
+                    )
             except Exception as e:
                 logger.warning("session_validation_error", error=str(e))
 
         return False
 
 
-def get_login_page_html(error: str = "", next_url: str = "/") -> str:
-    """Generate login page HTML."""
-    error_html = f'<p class="text-red-600 text-sm mb-4">{error}</p>' if error else ""
-
-    return f'''
+# Login page markup, built once; only $error_html and $next_url vary per request
+_LOGIN_PAGE_TEMPLATE = string.Template('''
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -171,10 +296,10 @@ def get_login_page_html(error: str = "", next_url: str = "/") -> str:
         <h1 class="text-2xl font-bold text-white text-center mb-2">Africa Comms Trends</h1>
         <p class="text-gray-400 text-center mb-6">Enter password to access dashboard</p>
 
-        {error_html}
+        $error_html
 
         <form method="POST" action="/auth/login">
-            <input type="hidden" name="next" value="{next_url}">
+            <input type="hidden" name="next" value="$next_url">
             <div class="mb-4">
                 <label class="block text-gray-300 text-sm font-medium mb-2" for="password">
                     Password
@@ -199,4 +324,15 @@ def get_login_page_html(error: str = "", next_url: str = "/") -> str:
     </div>
 </body>
 </html>
-'''
+''')
+
+
+def get_login_page_html(error: str = "", next_url: str = "/") -> str:
+    """Generate login page HTML."""
+    error_html = (
+        f'<p class="text-red-600 text-sm mb-4">{html.escape(error)}</p>' if error else ""
+    )
+    return _LOGIN_PAGE_TEMPLATE.substitute(
+        error_html=error_html,
+        next_url=html.escape(next_url),
+    )
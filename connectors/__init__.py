@@ -54,6 +54,7 @@ CONNECTOR_REGISTRY = {
 
 def get_connector(name: str) -> type:
     """Get connector class by name."""
-    if name not in CONNECTOR_REGISTRY:
-        raise ValueError(f"Unknown connector: {name}. Available: {list(CONNECTOR_REGISTRY.keys())}")
-    return CONNECTOR_REGISTRY[name]
+    connector_cls = CONNECTOR_REGISTRY.get(name)
+    if connector_cls is None:
+        raise ValueError(f"Unknown connector: {name}. Available: {', '.join(CONNECTOR_REGISTRY)}")
+    return connector_cls
@@ -9,6 +9,7 @@ import hashlib
 import statistics
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
+import numpy as np
 import structlog
 
 from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
@@ -50,45 +51,91 @@ MARKET_ARTISTS = {
     ],
 }
 
+# Max (market, time window) fetches running at once, to stay within
+# Google Trends rate limits
+MAX_CONCURRENT_MARKET_FETCHES = 4
+
+# Minimum spacing between pytrends requests across all concurrent fetches
+PYTRENDS_REQUEST_INTERVAL_SECONDS = 1.0
+
 # Common word artists that need disambiguation
-AMBIGUOUS_ARTISTS = {
+AMBIGUOUS_ARTISTS = frozenset({
     "Tems", "Rema", "Bien", "KiDi", "Tyla", "Ice",
-}
+})
 
 
 def generate_spike_id(artist: str, market: str, time_window: str) -> str:
-    """Generate unique ID for artist spike."""
+    """
+    Generate unique ID for artist spike.
+
+    Truncated SHA-256, matching the IDs already stored, so a refresh
+    upserts onto existing rows.
+    """
     key = f"{artist.lower()}:{market}:{time_window}"
     return hashlib.sha256(key.encode()).hexdigest()[:16]
 
 
-def calculate_spike_score(
-    current: float,
-    baseline: float,
+# Z-score method: approximate std dev as a fraction of the baseline mean,
+# and map z=3 to a score of 100
+ZSCORE_STD_RATIO = 0.3
+ZSCORE_FULL_SCALE = 3
+
+
+def _no_baseline_score(current: np.ndarray) -> np.ndarray:
+    """Score for artists with no baseline interest."""
+    return np.where(current > 0, np.minimum(100, current * 2), 0)
+
+
+def _spike_score_wow_vec(current: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Week-over-Week percentage change, clipped to 0-100."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.clip((current - baseline) / baseline * 100, 0, 100)
+    return np.where(baseline <= 0, _no_baseline_score(current), change)
+
+
+def _spike_score_zscore_vec(current: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Approximate z-score vs baseline, normalized to 0-100."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (current - baseline) / (baseline * ZSCORE_STD_RATIO)
+        score = np.clip(z / ZSCORE_FULL_SCALE * 100, 0, 100)
+    return np.where(baseline <= 0, _no_baseline_score(current), score)
+
+
+SPIKE_SCORE_METHODS = {
+    "wow": _spike_score_wow_vec,
+    "zscore": _spike_score_zscore_vec,
+}
+
+
+def calculate_spike_scores(
+    current: np.ndarray,
+    baseline: np.ndarray,
     method: str = "wow"
-) -> float:
+) -> np.ndarray:
     """
-    Calculate spike score (0-100).
+    Calculate spike scores (0-100) for a batch of artists.
 
     Methods:
     - wow: Week-over-Week percentage change
     - zscore: Z-score vs baseline, normalized to 0-100
+
+    Unknown methods score 0.
     """
-    if method == "wow":
-        if baseline <= 0:
-            return min(100, current * 2) if current > 0 else 0
-        change = ((current - baseline) / baseline) * 100
-        return min(100, max(0, change))
+    current = np.asarray(current, dtype=np.float64)
+    baseline = np.asarray(baseline, dtype=np.float64)
+    kernel = SPIKE_SCORE_METHODS.get(method)
+    if kernel is None:
+        return np.zeros(np.broadcast(current, baseline).shape)
+    return kernel(current, baseline)
 
-    elif method == "zscore":
-        # Assume baseline is mean, calculate approximate z-score
-        if baseline <= 0:
-            return min(100, current * 2) if current > 0 else 0
-        z = (current - baseline) / (baseline * 0.3)  # Approx std dev
-        # Normalize z-score to 0-100 (z=3 -> 100)
-        return min(100, max(0, (z / 3) * 100))
 
-    return 0
+def calculate_spike_score(
+    current: float,
+    baseline: float,
+    method: str = "wow"
+) -> float:
+    """Calculate spike score (0-100) for a single artist."""
+    return float(calculate_spike_scores([current], [baseline], method)[0])
 
 
 def determine_confidence(
@@ -123,27 +170,45 @@ class ArtistSpikesConnector(BaseConnector):
 
     def __init__(self, config: dict):
         super().__init__(config)
-        self._pytrends = None
-        # Allow config to extend artist lists
-        self.artists_by_market = {**MARKET_ARTISTS}
+        # Allow config to extend artist lists (copied so the seed lists stay intact)
+        self.artists_by_market = {
+            market: list(artists) for market, artists in MARKET_ARTISTS.items()
+        }
         config_artists = config.get("entities", {}).get("artists", [])
         if config_artists:
             # Add config artists to all markets
-            for market in self.artists_by_market:
+            for market, artists in self.artists_by_market.items():
+                seen = set(artists)
                 for artist in config_artists:
-                    if artist not in self.artists_by_market[market]:
-                        self.artists_by_market[market].append(artist)
+                    if artist not in seen:
+                        seen.add(artist)
+                        artists.append(artist)
 
-    def _get_pytrends(self):
-        """Lazy load pytrends."""
-        if self._pytrends is None:
-            try:
-                from pytrends.request import TrendReq
-                self._pytrends = TrendReq(hl="en-US", tz=120)
-            except ImportError:
-                self.logger.error("pytrends not installed")
-                raise
-        return self._pytrends
+    async def _run_pytrends(self, func, *args, **kwargs):
+        """Run a blocking pytrends call in the executor, rate limited."""
+        await self._throttle(PYTRENDS_REQUEST_INTERVAL_SECONDS)
+        return await self._run_blocking(func, *args, **kwargs)
+
+    async def _gather_market_spikes(self, jobs: List[tuple]) -> list:
+        """
+        Fetch spikes for (market, time_window) jobs concurrently.
+
+        A pytrends session holds the payload of its last build_payload call,
+        so each job gets its own session. At most MAX_CONCURRENT_MARKET_FETCHES
+        jobs run at once. Results are returned in job order, with failures
+        returned as exceptions.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_MARKET_FETCHES)
+
+        async def run(market: str, time_window: str) -> List[ArtistSpike]:
+            async with semaphore:
+                pytrends = await self._run_pytrends(self._create_pytrends)
+                return await self._fetch_market_spikes(pytrends, market, time_window)
+
+        return await asyncio.gather(
+            *(run(market, time_window) for market, time_window in jobs),
+            return_exceptions=True,
+        )
 
     async def fetch(
         self,
@@ -158,58 +223,61 @@ class ArtistSpikesConnector(BaseConnector):
         if markets is None:
             markets = list(MARKET_GEO_MAP.keys())
 
-        try:
-            pytrends = self._get_pytrends()
-        except ImportError:
+        if not self._pytrends_available():
+            self.logger.error("pytrends not installed")
             return self._create_result(
                 items=[],
                 status=SourceStatus.UNAVAILABLE,
                 errors=["pytrends library not installed"],
             )
 
-        for market in markets:
-            if market not in MARKET_GEO_MAP:
+        # Fetch both time windows for every market
+        jobs = [
+            (market, time_window)
+            for market in markets
+            if market in MARKET_GEO_MAP
+            for time_window in ("24h", "7d")
+        ]
+        results = await self._gather_market_spikes(jobs)
+
+        for (market, time_window), spikes in zip(jobs, results):
+            if isinstance(spikes, Exception):
+                errors.append(f"Error fetching spikes for {market} ({time_window}): {str(spikes)}")
+                self.logger.error(
+                    "artist_spikes_error", market=market, time_window=time_window, error=str(spikes)
+                )
                 continue
 
-            try:
-                # Fetch for both time windows
-                for time_window in ["24h", "7d"]:
-                    spikes = await self._fetch_market_spikes(
-                        pytrends, market, time_window
-                    )
-                    # Convert ArtistSpike to TrendItem for connector interface
-                    for spike in spikes:
-                        items.append(TrendItem(
-                            id=spike.id,
-                            source=self.name,
-                            title=f"{spike.artist_name} search spike",
-                            description="; ".join(spike.why_spiking) if spike.why_spiking else f"Rising search interest in {market}",
-                            market=market,
-                            volume=int(spike.current_interest),
-                            velocity=spike.spike_score / 100,
-                            metadata={
-                                "type": "artist_spike",
-                                "artist_name": spike.artist_name,
-                                "spike_score": spike.spike_score,
-                                "time_window": spike.time_window,
-                                "sparkline_data": spike.sparkline_data,
-                                "why_spiking": spike.why_spiking,
-                                "confidence": spike.confidence,
-                                "is_ambiguous": spike.is_ambiguous,
-                                "related_queries": spike.related_queries,
-                                "related_topics": spike.related_topics,
-                            }
-                        ))
-
-            except Exception as e:
-                errors.append(f"Error fetching spikes for {market}: {str(e)}")
-                self.logger.error("artist_spikes_error", market=market, error=str(e))
-
-            await asyncio.sleep(1)
+            # Convert ArtistSpike to TrendItem for connector interface
+            items.extend(self._spike_to_trend_item(spike, market) for spike in spikes)
 
         status = SourceStatus.ACTIVE if not errors else SourceStatus.DEGRADED
         return self._create_result(items, status, errors)
 
+    def _spike_to_trend_item(self, spike: ArtistSpike, market: str) -> TrendItem:
+        """Convert an ArtistSpike to a TrendItem."""
+        return TrendItem(
+            id=spike.id,
+            source=self.name,
+            title=f"{spike.artist_name} search spike",
+            description="; ".join(spike.why_spiking) if spike.why_spiking else f"Rising search interest in {market}",
+            market=market,
+            volume=int(spike.current_interest),
+            velocity=spike.spike_score / 100,
+            metadata={
+                "type": "artist_spike",
+                "artist_name": spike.artist_name,
+                "spike_score": spike.spike_score,
+                "time_window": spike.time_window,
+                "sparkline_data": spike.sparkline_data,
+                "why_spiking": spike.why_spiking,
+                "confidence": spike.confidence,
+                "is_ambiguous": spike.is_ambiguous,
+                "related_queries": spike.related_queries,
+                "related_topics": spike.related_topics,
+            }
+        )
+
     async def fetch_spikes(
         self,
         markets: List[str] = None,
@@ -225,22 +293,18 @@ class ArtistSpikesConnector(BaseConnector):
 
         all_spikes = []
 
-        try:
-            pytrends = self._get_pytrends()
-        except ImportError:
+        if not self._pytrends_available():
+            self.logger.error("pytrends not installed")
             return []
 
-        for market in markets:
-            if market not in MARKET_GEO_MAP:
-                continue
-
-            try:
-                spikes = await self._fetch_market_spikes(pytrends, market, time_window)
-                all_spikes.extend(spikes)
-            except Exception as e:
-                self.logger.error("fetch_spikes_error", market=market, error=str(e))
+        jobs = [(market, time_window) for market in markets if market in MARKET_GEO_MAP]
+        results = await self._gather_market_spikes(jobs)
 
-            await asyncio.sleep(1)
+        for (market, _), spikes in zip(jobs, results):
+            if isinstance(spikes, Exception):
+                self.logger.error("fetch_spikes_error", market=market, error=str(spikes))
+                continue
+            all_spikes.extend(spikes)
 
         # Sort by spike score and return top 20 per market
         market_spikes: Dict[str, List[ArtistSpike]] = {}
@@ -278,46 +342,66 @@ class ArtistSpikesConnector(BaseConnector):
             batch = artists[i:i+5]
 
             try:
-                loop = asyncio.get_event_loop()
-
                 # Build payload
-                await loop.run_in_executor(
-                    None,
-                    lambda: pytrends.build_payload(batch, timeframe=timeframe, geo=geo)
+                await self._run_pytrends(
+                    pytrends.build_payload, batch, timeframe=timeframe, geo=geo
                 )
 
                 # Get interest over time
-                interest = await loop.run_in_executor(
-                    None,
-                    pytrends.interest_over_time
-                )
+                interest = await self._run_pytrends(pytrends.interest_over_time)
 
+                present = []
                 if interest is not None and not interest.empty:
-                    for artist in batch:
-                        if artist not in interest.columns:
-                            continue
-
-                        series = interest[artist]
-                        current = float(series.iloc[-1])
-
-                        # Calculate baseline (mean excluding last point)
-                        if len(series) > 1:
-                            baseline = float(series.iloc[:-1].mean())
-                        else:
-                            baseline = 0
-
-                        # Calculate spike score
-                        spike_score = calculate_spike_score(current, baseline)
-
-                        # Skip low-spike artists
-                        if spike_score < 10:
-                            continue
-
-                        # Generate sparkline data (7 points)
-                        if len(series) >= 7:
-                            sparkline = [float(x) for x in series.iloc[-7:].tolist()]
-                        else:
-                            sparkline = [float(x) for x in series.tolist()]
+                    present = [a for a in batch if a in interest.columns]
+
+                if present:
+                    # Score the whole batch at once: rows are time, columns artists
+                    values = interest[present].to_numpy(dtype=np.float64)
+                    currents = values[-1]
+
+                    # Calculate baseline (mean excluding last point)
+                    if len(values) > 1:
+                        baselines = values[:-1].mean(axis=0)
+                    else:
+                        baselines = np.zeros(len(present))
+
+                    spike_scores = calculate_spike_scores(currents, baselines)
+
+                    # Sparkline data (last 7 points) per artist, converted to
+                    # Python floats in one pass
+                    sparklines = values[-7:].T.tolist()
+
+                    # Skip low-spike artists
+                    qualifying = [
+                        idx for idx in range(len(present)) if spike_scores[idx] >= 10
+                    ]
+
+                    # Related queries/topics are returned for every artist in
+                    # the batch payload, so one call of each covers the batch.
+                    # Both only read the payload, so they can run side by side.
+                    related = {}
+                    topics = {}
+                    if qualifying:
+                        related, topics = await asyncio.gather(
+                            self._run_pytrends(pytrends.related_queries),
+                            self._run_pytrends(pytrends.related_topics),
+                            return_exceptions=True,
+                        )
+                        if isinstance(related, Exception):
+                            self.logger.debug("related_queries_error", batch=batch, error=str(related))
+                            related = None
+                        if isinstance(topics, Exception):
+                            self.logger.debug("related_topics_error", batch=batch, error=str(topics))
+                            topics = None
+                        related = related or {}
+                        topics = topics or {}
+
+                    for idx in qualifying:
+                        artist = present[idx]
+                        spike_score = float(spike_scores[idx])
+                        current = float(currents[idx])
+                        baseline = float(baselines[idx])
+                        sparkline = sparklines[idx]
 
                         # Get related queries for "why spiking"
                         why_spiking = []
@@ -325,18 +409,7 @@ class ArtistSpikesConnector(BaseConnector):
                         related_topics = []
 
                         try:
-                            # Build payload for single artist to get related
-                            await loop.run_in_executor(
-                                None,
-                                lambda a=artist: pytrends.build_payload([a], timeframe=timeframe, geo=geo)
-                            )
-
-                            related = await loop.run_in_executor(
-                                None,
-                                pytrends.related_queries
-                            )
-
-                            if related and artist in related:
+                            if artist in related:
                                 rising = related[artist].get("rising")
                                 if rising is not None and not rising.empty:
                                     queries = rising["query"].head(5).tolist()
@@ -346,12 +419,7 @@ class ArtistSpikesConnector(BaseConnector):
                                         if artist.lower() not in q.lower():
                                             why_spiking.append(f"Related to: {q}")
 
-                            topics = await loop.run_in_executor(
-                                None,
-                                pytrends.related_topics
-                            )
-
-                            if topics and artist in topics:
+                            if artist in topics:
                                 rising = topics[artist].get("rising")
                                 if rising is not None and not rising.empty:
                                     topic_titles = rising["topic_title"].head(5).tolist()
@@ -401,19 +469,13 @@ class ArtistSpikesConnector(BaseConnector):
             except Exception as e:
                 self.logger.warning("batch_error", batch=batch, market=market, error=str(e))
 
-            await asyncio.sleep(0.5)
-
         return spikes
 
     async def health_check(self) -> bool:
         """Check if Google Trends is accessible."""
         try:
             pytrends = self._get_pytrends()
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: pytrends.trending_searches(pn="south_africa")
-            )
+            result = await self._run_blocking(pytrends.trending_searches, pn="south_africa")
             return result is not None
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
@@ -5,16 +5,36 @@ All data source connectors must inherit from BaseConnector
 and implement the required methods.
 """
 
+import asyncio
+import functools
+import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, NamedTuple, Optional
 import hashlib
+import operator
+import time
 import structlog
 
 logger = structlog.get_logger()
 
+# Worker threads for blocking SDK calls (pytrends, PRAW, ...), shared by
+# every connector instead of asyncio's small default executor
+CONNECTOR_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CONNECTOR_THREADS", "32")),
+    thread_name_prefix="connector",
+)
+
+# Connection pool limits for each connector's shared HTTP session
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 8
+HTTP_DNS_CACHE_SECONDS = 300
+HTTP_KEEPALIVE_SECONDS = 60
+HTTP_TIMEOUT_SECONDS = 30
+
 
 class SourceStatus(Enum):
     """Status of a data source connector."""
@@ -25,7 +45,7 @@ class SourceStatus(Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendItem:
     """A single trend item collected from a source."""
 
@@ -70,28 +90,20 @@ class TrendItem:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
-        return {
-            "id": self.id,
-            "source": self.source,
-            "source_url": self.source_url,
-            "title": self.title,
-            "description": self.description,
-            "raw_text": self.raw_text,
-            "topic": self.topic,
-            "subtopic": self.subtopic,
-            "market": self.market,
-            "language": self.language,
-            "volume": self.volume,
-            "engagement": self.engagement,
-            "velocity": self.velocity,
-            "entities": self.entities,
-            "published_at": self.published_at.isoformat() if self.published_at else None,
-            "collected_at": self.collected_at.isoformat(),
-            "metadata": self.metadata,
-        }
-
-
-@dataclass
+        data = dict(zip(_TREND_ITEM_FIELDS, _get_trend_item_values(self)))
+        if self.published_at:
+            data["published_at"] = self.published_at.isoformat()
+        data["collected_at"] = self.collected_at.isoformat()
+        return data
+
+
+# TrendItem field names and a getter returning their values as a tuple,
+# computed once so to_dict doesn't rebuild the mapping field by field
+_TREND_ITEM_FIELDS = tuple(f.name for f in fields(TrendItem))
+_get_trend_item_values = operator.attrgetter(*_TREND_ITEM_FIELDS)
+
+
+@dataclass(slots=True)
 class ConnectorResult:
     """Result from a connector fetch operation."""
 
@@ -128,6 +140,19 @@ class ConnectorResult:
         return 0.0
 
 
+class CachedFeed(NamedTuple):
+    """Parsed entries of a feed with the validators to revalidate them."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    entries: list
+
+
+# Feeds served with ETag/Last-Modified, keyed by connector name and URL, so
+# unchanged feeds are answered with 304 Not Modified and not downloaded or
+# parsed again
+_feed_cache: dict[tuple[str, str], CachedFeed] = {}
+
+
 class BaseConnector(ABC):
     """
     Abstract base class for all data source connectors.
@@ -144,6 +169,9 @@ class BaseConnector(ABC):
     display_name: str = "Base Connector"
     requires_auth: bool = False
 
+    # Default headers for the connector's shared HTTP session
+    http_headers: Optional[dict] = None
+
     def __init__(self, config: dict):
         """
         Initialize the connector with configuration.
@@ -158,6 +186,11 @@ class BaseConnector(ABC):
         self.rate_limit = config.get("rate_limit", 100)
         self._status = SourceStatus.ACTIVE
         self._last_fetch: Optional[datetime] = None
+        self._inflight: dict[Any, asyncio.Future] = {}
+        self._session = None
+        self._pytrends = None
+        self._throttle_lock = asyncio.Lock()
+        self._next_request_at = 0.0
 
         self.logger = structlog.get_logger().bind(connector=self.name)
 
@@ -174,6 +207,148 @@ class BaseConnector(ABC):
         """Check if required credentials are configured."""
         return True  # Override in subclasses
 
+    def _get_session(self):
+        """
+        Get the connector's pooled aiohttp session, creating it on first use.
+
+        The session keeps connections alive between requests and fetches,
+        and caps connections per host. Close it with aclose().
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_CONNECTION_LIMIT,
+                    limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                    ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+                    keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+                ),
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+                headers=self.http_headers,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the connector's HTTP session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _coalesce(self, key, func, *args, **kwargs):
+        """
+        Await ``func(*args, **kwargs)``, sharing one call among concurrent callers.
+
+        While a call for ``key`` is in flight, later callers with the same
+        key await its result instead of issuing a duplicate request. The
+        shared call is shielded, so one caller being cancelled does not
+        cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._inflight[key] = task
+
+            def forget(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call on the shared connector thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            CONNECTOR_EXECUTOR, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _throttle(self, interval: float) -> None:
+        """
+        Wait until the connector's next request slot.
+
+        Slots are spaced ``interval`` seconds apart from when the previous
+        request started, so time spent waiting on the source counts toward
+        the interval instead of being added on top of it, and the pause only
+        applies when requests are actually being made back to back.
+        """
+        async with self._throttle_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = time.monotonic() + interval
+
+    def _create_pytrends(self):
+        """Create a new pytrends session."""
+        try:
+            from pytrends.request import TrendReq
+        except ImportError:
+            self.logger.error("pytrends not installed")
+            raise
+        return TrendReq(hl="en-US", tz=120)  # GMT+2 for Africa
+
+    def _get_pytrends(self):
+        """Lazy load the connector's shared pytrends session."""
+        if self._pytrends is None:
+            self._pytrends = self._create_pytrends()
+        return self._pytrends
+
+    @staticmethod
+    def _pytrends_available() -> bool:
+        """Check that pytrends can be imported."""
+        try:
+            import pytrends  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    async def _load_feed_entries(
+        self,
+        session,
+        feed_name: str,
+        url: str,
+        parse: Callable[[bytes], list],
+    ) -> list:
+        """
+        Download a feed and parse its raw bytes off the event loop.
+
+        Parsed entries are cached while the feed sends ETag or Last-Modified
+        and revalidated with a conditional GET, so an unchanged feed is
+        neither downloaded nor parsed again. Returns [] on a non-200 response.
+        """
+        cache_key = (self.name, url)
+        cached = _feed_cache.get(cache_key)
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached.entries
+            if response.status != 200:
+                self.logger.warning(
+                    "feed_fetch_failed",
+                    feed=feed_name,
+                    status=response.status
+                )
+                return []
+
+            content = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        entries = await self._run_blocking(parse, content)
+
+        if etag or last_modified:
+            _feed_cache[cache_key] = CachedFeed(etag, last_modified, entries)
+        else:
+            _feed_cache.pop(cache_key, None)
+
+        return entries
+
     @abstractmethod
     async def fetch(
         self,
@@ -248,6 +423,19 @@ class BaseConnector(ABC):
         """Normalize market code to standard format."""
         return market.upper().strip()
 
+    def _prepare_keywords(self, keywords: Optional[list[str]]) -> tuple[str, ...]:
+        """
+        Lowercase keywords for substring filtering.
+
+        Keywords that contain another keyword are dropped, since any text
+        they match is already matched by the shorter one.
+        """
+        lowered = {k.lower() for k in keywords or ()}
+        return tuple(
+            k for k in lowered
+            if not any(other != k and other in k for other in lowered)
+        )
+
     def _extract_language(self, text: str) -> Optional[str]:
         """
         Detect language of text.
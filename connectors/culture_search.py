@@ -5,9 +5,13 @@ Fetches Google Trends rising queries by category for cultural moments.
 """
 
 import asyncio
+import functools
 import hashlib
+import heapq
 import re
-from datetime import datetime
+from collections import defaultdict
+from operator import attrgetter
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Set
 import structlog
 
@@ -45,6 +49,14 @@ CATEGORY_IDS = {
     "celebrities": 184,
 }
 
+# Max pytrends requests in flight at once across all markets
+MAX_CONCURRENT_REQUESTS = 2
+
+# Minimum spacing between pytrends request starts, across all markets; the
+# same pace as artist_spikes, since each market issues several category
+# queries and Google Trends answers faster bursts with 429s
+PYTRENDS_REQUEST_INTERVAL_SECONDS = 1.0
+
 # Keywords for sensitivity tag classification
 SENSITIVITY_PATTERNS = {
     SensitivityTag.MUSIC.value: [
@@ -78,12 +90,30 @@ SENSITIVITY_PATTERNS = {
     ],
 }
 
+# All sensitivity patterns in one regex. Each tag's alternative is anchored
+# with a lazy ``.*?`` so earlier tags are tried against the whole term before
+# later ones, matching the SENSITIVITY_PATTERNS priority order. Terms are
+# lowercased before matching, so no IGNORECASE is needed.
+_SENSITIVITY_RE = re.compile(
+    "|".join(
+        f".*?(?P<{tag}>{'|'.join(patterns)})"
+        for tag, patterns in SENSITIVITY_PATTERNS.items()
+    ),
+    re.DOTALL,
+)
+
 # High risk political terms
 POLITICAL_RISK_TERMS = [
     "protest", "strike", "riot", "violence", "arrest", "corruption",
     "scandal", "controversy", "death", "killed", "war", "conflict",
 ]
 
+# Characters stripped from formatted rise values like "+1,250%"
+_RISE_VALUE_STRIP = str.maketrans("", "", ",+%")
+
+# Sort key for ranking searches
+_rise_percentage = attrgetter("rise_percentage")
+
 
 def generate_search_id(term: str, market: str) -> str:
     """Generate unique ID for culture search."""
@@ -91,24 +121,24 @@ def generate_search_id(term: str, market: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()[:16]
 
 
-def classify_sensitivity(term: str) -> str:
-    """Classify a term into a sensitivity tag."""
-    term_lower = term.lower()
+# Max distinct terms remembered by the classification caches
+CLASSIFICATION_CACHE_SIZE = 4096
 
-    # Check each category
-    for tag, patterns in SENSITIVITY_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, term_lower, re.IGNORECASE):
-                return tag
+
+@functools.lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_cached(term_lower: str) -> str:
+    """Classify a lowercased term into a sensitivity tag."""
+    match = _SENSITIVITY_RE.match(term_lower)
+    if match:
+        return match.lastgroup
 
     # Default to celebrity for unclassified
     return SensitivityTag.CELEBRITY.value
 
 
-def determine_risk_level(term: str, sensitivity_tag: str) -> str:
-    """Determine risk level based on content."""
-    term_lower = term.lower()
-
+@functools.lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _risk_level_cached(term_lower: str, sensitivity_tag: str) -> str:
+    """Determine risk level for a lowercased term."""
     # Politics is always high sensitivity
     if sensitivity_tag == SensitivityTag.POLITICS.value:
         return "high"
@@ -127,6 +157,16 @@ def determine_risk_level(term: str, sensitivity_tag: str) -> str:
     return "low"
 
 
+def classify_sensitivity(term: str) -> str:
+    """Classify a term into a sensitivity tag."""
+    return _classify_cached(term.lower())
+
+
+def determine_risk_level(term: str, sensitivity_tag: str) -> str:
+    """Determine risk level based on content."""
+    return _risk_level_cached(term.lower(), sensitivity_tag)
+
+
 class CultureSearchConnector(BaseConnector):
     """
     Connector for rising culture search terms.
@@ -144,18 +184,26 @@ class CultureSearchConnector(BaseConnector):
 
     def __init__(self, config: dict):
         super().__init__(config)
-        self._pytrends = None
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-    def _get_pytrends(self):
-        """Lazy load pytrends."""
-        if self._pytrends is None:
-            try:
-                from pytrends.request import TrendReq
-                self._pytrends = TrendReq(hl="en-US", tz=120)
-            except ImportError:
-                self.logger.error("pytrends not installed")
-                raise
-        return self._pytrends
+    async def _gather_market_culture(self, markets: List[str]) -> list:
+        """
+        Fetch culture searches for several markets concurrently.
+
+        A pytrends session holds the payload of its last build_payload call,
+        so each market gets its own session. Results are returned in market
+        order, with failures returned as exceptions.
+        """
+        async def run(market: str) -> List[CultureSearch]:
+            async with self._request_semaphore:
+                await self._throttle(PYTRENDS_REQUEST_INTERVAL_SECONDS)
+                pytrends = await self._run_blocking(self._create_pytrends)
+            return await self._fetch_market_culture(pytrends, market)
+
+        return await asyncio.gather(
+            *(run(market) for market in markets),
+            return_exceptions=True,
+        )
 
     async def fetch(
         self,
@@ -170,45 +218,42 @@ class CultureSearchConnector(BaseConnector):
         if markets is None:
             markets = list(MARKET_GEO_MAP.keys())
 
-        try:
-            pytrends = self._get_pytrends()
-        except ImportError:
+        if not self._pytrends_available():
+            self.logger.error("pytrends not installed")
             return self._create_result(
                 items=[],
                 status=SourceStatus.UNAVAILABLE,
                 errors=["pytrends library not installed"],
             )
 
-        for market in markets:
-            if market not in MARKET_GEO_MAP:
-                continue
-
-            try:
-                searches = await self._fetch_market_culture(pytrends, market)
-                for search in searches:
-                    items.append(TrendItem(
-                        id=search.id,
-                        source=self.name,
-                        title=search.term,
-                        description=f"Rising {search.sensitivity_tag} search in {market}",
-                        market=market,
-                        volume=search.volume,
-                        velocity=search.rise_percentage / 100,
-                        metadata={
-                            "type": "culture_search",
-                            "sensitivity_tag": search.sensitivity_tag,
-                            "rise_percentage": search.rise_percentage,
-                            "risk_level": search.risk_level,
-                            "is_cross_market": search.is_cross_market,
-                            "markets_present": search.markets_present,
-                        }
-                    ))
+        markets = [market for market in markets if market in MARKET_GEO_MAP]
+        results = await self._gather_market_culture(markets)
 
-            except Exception as e:
-                errors.append(f"Error fetching culture for {market}: {str(e)}")
-                self.logger.error("culture_search_error", market=market, error=str(e))
+        for market, searches in zip(markets, results):
+            if isinstance(searches, Exception):
+                errors.append(f"Error fetching culture for {market}: {str(searches)}")
+                self.logger.error("culture_search_error", market=market, error=str(searches))
+                continue
 
-            await asyncio.sleep(1)
+            for search in searches:
+                items.append(TrendItem(
+                    id=search.id,
+                    source=self.name,
+                    title=search.term,
+                    description=f"Rising {search.sensitivity_tag} search in {market}",
+                    market=market,
+                    volume=search.volume,
+                    velocity=search.rise_percentage / 100,
+                    collected_at=search.collected_at,
+                    metadata={
+                        "type": "culture_search",
+                        "sensitivity_tag": search.sensitivity_tag,
+                        "rise_percentage": search.rise_percentage,
+                        "risk_level": search.risk_level,
+                        "is_cross_market": search.is_cross_market,
+                        "markets_present": search.markets_present,
+                    }
+                ))
 
         status = SourceStatus.ACTIVE if not errors else SourceStatus.DEGRADED
         return self._create_result(items, status, errors)
@@ -228,26 +273,22 @@ class CultureSearchConnector(BaseConnector):
         all_searches: List[CultureSearch] = []
         terms_by_market: Dict[str, Set[str]] = {}
 
-        try:
-            pytrends = self._get_pytrends()
-        except ImportError:
+        if not self._pytrends_available():
+            self.logger.error("pytrends not installed")
             return []
 
-        for market in markets:
-            if market not in MARKET_GEO_MAP:
-                continue
-
-            try:
-                searches = await self._fetch_market_culture(pytrends, market)
-                all_searches.extend(searches)
+        markets = [market for market in markets if market in MARKET_GEO_MAP]
+        results = await self._gather_market_culture(markets)
 
-                # Track terms by market for cross-market detection
-                terms_by_market[market] = {s.term.lower() for s in searches}
+        for market, searches in zip(markets, results):
+            if isinstance(searches, Exception):
+                self.logger.error("fetch_searches_error", market=market, error=str(searches))
+                continue
 
-            except Exception as e:
-                self.logger.error("fetch_searches_error", market=market, error=str(e))
+            all_searches.extend(searches)
 
-            await asyncio.sleep(1)
+            # Track terms by market for cross-market detection
+            terms_by_market[market] = {s.term.lower() for s in searches}
 
         # Detect cross-market terms
         all_searches = self._detect_cross_market(all_searches, terms_by_market)
@@ -264,23 +305,45 @@ class CultureSearchConnector(BaseConnector):
         geo = MARKET_GEO_MAP[market]
         trending_pn = MARKET_TRENDING_MAP.get(market)
         seen_terms: Set[str] = set()
+        # One collection timestamp for every search in this fetch (naive UTC)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         # Skip if market not supported for trending searches
         if not trending_pn:
             self.logger.warning("market_not_supported_for_trending", market=market)
             return searches
 
-        # Fetch trending searches
+        # Category-specific rising queries use market-relevant seed terms
+        market_seeds = {
+            "NG": ["afrobeats", "naija", "lagos"],
+            "KE": ["nairobi", "kenya music", "gengetone"],
+            "GH": ["ghana music", "accra", "highlife"],
+            "ZA": ["amapiano", "johannesburg", "south africa music"],
+        }
+        seed_terms = market_seeds.get(market, ["africa", "trending"])
+
+        # Trending searches and the category queries are requested together.
+        # The categories share the market's pytrends session, whose
+        # build_payload state must not change before related_queries reads
+        # it, so they take turns on payload_lock.
+        payload_lock = asyncio.Lock()
+        trending, *related_by_category = await asyncio.gather(
+            self._fetch_trending(pytrends, trending_pn),
+            *(
+                self._fetch_category_related(pytrends, payload_lock, seed_terms[:1], category_id, geo)
+                for category_id in CATEGORY_IDS.values()
+            ),
+            return_exceptions=True,
+        )
+
+        # Trending searches first, so their terms win de-duplication
         try:
-            loop = asyncio.get_event_loop()
-            trending = await loop.run_in_executor(
-                None,
-                lambda: pytrends.trending_searches(pn=trending_pn)
-            )
+            if isinstance(trending, Exception):
+                raise trending
 
             if trending is not None and not trending.empty:
-                for idx, row in trending.head(20).iterrows():
-                    term = str(row.iloc[0]) if hasattr(row, 'iloc') else str(row[0])
+                for idx, term in enumerate(trending.iloc[:20, 0].tolist()):
+                    term = str(term)
                     term_lower = term.lower()
 
                     if term_lower in seen_terms:
@@ -288,8 +351,8 @@ class CultureSearchConnector(BaseConnector):
                     seen_terms.add(term_lower)
 
                     # Classify sensitivity
-                    sensitivity_tag = classify_sensitivity(term)
-                    risk_level = determine_risk_level(term, sensitivity_tag)
+                    sensitivity_tag = _classify_cached(term_lower)
+                    risk_level = _risk_level_cached(term_lower, sensitivity_tag)
 
                     # Estimate rise percentage (based on rank)
                     rise_percentage = max(100, 500 - idx * 20)
@@ -302,42 +365,20 @@ class CultureSearchConnector(BaseConnector):
                         rise_percentage=rise_percentage,
                         volume=100 - idx * 4,  # Rough volume estimate
                         is_cross_market=False,
-                        markets_present=[market],
+                        markets_present=(market,),
                         risk_level=risk_level,
-                        collected_at=datetime.utcnow(),
+                        collected_at=now,
                     )
                     searches.append(search)
 
         except Exception as e:
             self.logger.warning("trending_searches_error", market=market, error=str(e))
 
-        # Fetch category-specific rising queries using market-relevant seed terms
-        market_seeds = {
-            "NG": ["afrobeats", "naija", "lagos"],
-            "KE": ["nairobi", "kenya music", "gengetone"],
-            "GH": ["ghana music", "accra", "highlife"],
-            "ZA": ["amapiano", "johannesburg", "south africa music"],
-        }
-
-        for category_name, category_id in CATEGORY_IDS.items():
+        # Then category rising queries, in CATEGORY_IDS order
+        for category_name, related in zip(CATEGORY_IDS, related_by_category):
             try:
-                # Use market-specific seed terms for better results
-                seed_terms = market_seeds.get(market, ["africa", "trending"])
-
-                await loop.run_in_executor(
-                    None,
-                    lambda: pytrends.build_payload(
-                        seed_terms[:1],
-                        cat=category_id,
-                        timeframe="now 7-d",
-                        geo=geo
-                    )
-                )
-
-                related = await loop.run_in_executor(
-                    None,
-                    pytrends.related_queries
-                )
+                if isinstance(related, Exception):
+                    raise related
 
                 if related:
                     for seed in seed_terms[:1]:
@@ -348,11 +389,15 @@ class CultureSearchConnector(BaseConnector):
                         if rising is None or rising.empty:
                             continue
 
-                        for _, qrow in rising.head(5).iterrows():
-                            term = qrow.get("query", "")
-                            if not term or term.lower() in seen_terms:
+                        for term, rise_value in rising[["query", "value"]].head(5).itertuples(
+                            index=False, name=None
+                        ):
+                            if not term:
+                                continue
+                            term_lower = term.lower()
+                            if term_lower in seen_terms:
                                 continue
-                            seen_terms.add(term.lower())
+                            seen_terms.add(term_lower)
 
                             # Map category to sensitivity tag
                             tag_map = {
@@ -364,12 +409,11 @@ class CultureSearchConnector(BaseConnector):
                                 "fashion": SensitivityTag.FASHION.value,
                                 "celebrities": SensitivityTag.CELEBRITY.value,
                             }
-                            sensitivity_tag = tag_map.get(category_name, classify_sensitivity(term))
-                            risk_level = determine_risk_level(term, sensitivity_tag)
+                            sensitivity_tag = tag_map.get(category_name, _classify_cached(term_lower))
+                            risk_level = _risk_level_cached(term_lower, sensitivity_tag)
 
-                            rise_value = qrow.get("value", 100)
                             if isinstance(rise_value, str):
-                                rise_value = int(rise_value.replace(",", "").replace("+", "").replace("%", "") or 100)
+                                rise_value = int(rise_value.translate(_RISE_VALUE_STRIP) or 100)
 
                             search = CultureSearch(
                                 id=generate_search_id(term, market),
@@ -379,20 +423,47 @@ class CultureSearchConnector(BaseConnector):
                                 rise_percentage=float(rise_value),
                                 volume=50,
                                 is_cross_market=False,
-                                markets_present=[market],
+                                markets_present=(market,),
                                 risk_level=risk_level,
-                                collected_at=datetime.utcnow(),
+                                collected_at=now,
                             )
                             searches.append(search)
 
-                await asyncio.sleep(0.3)
-
             except Exception as e:
                 self.logger.debug("category_error", category=category_name, error=str(e))
 
-        # Sort by rise percentage and limit to top 10
-        searches.sort(key=lambda x: x.rise_percentage, reverse=True)
-        return searches[:10]
+        # Top 10 by rise percentage
+        return heapq.nlargest(10, searches, key=_rise_percentage)
+
+    async def _fetch_trending(self, pytrends, trending_pn: str):
+        """Fetch today's trending searches for a country."""
+        async with self._request_semaphore:
+            await self._throttle(PYTRENDS_REQUEST_INTERVAL_SECONDS)
+            return await self._run_blocking(pytrends.trending_searches, pn=trending_pn)
+
+    async def _fetch_category_related(
+        self,
+        pytrends,
+        payload_lock: asyncio.Lock,
+        keywords: List[str],
+        category_id: int,
+        geo: str,
+    ) -> Optional[dict]:
+        """Fetch related queries for keywords within one Trends category."""
+        async with payload_lock:
+            async with self._request_semaphore:
+                await self._throttle(PYTRENDS_REQUEST_INTERVAL_SECONDS)
+                await self._run_blocking(
+                    pytrends.build_payload,
+                    keywords,
+                    cat=category_id,
+                    timeframe="now 7-d",
+                    geo=geo
+                )
+
+            async with self._request_semaphore:
+                await self._throttle(PYTRENDS_REQUEST_INTERVAL_SECONDS)
+                return await self._run_blocking(pytrends.related_queries)
 
     def _detect_cross_market(
         self,
@@ -401,25 +472,26 @@ class CultureSearchConnector(BaseConnector):
     ) -> List[CultureSearch]:
         """Detect and mark cross-market terms."""
         # Find terms present in multiple markets
-        all_terms: Dict[str, List[str]] = {}
+        all_terms: Dict[str, List[str]] = defaultdict(list)
         for market, terms in terms_by_market.items():
             for term in terms:
-                if term not in all_terms:
-                    all_terms[term] = []
                 all_terms[term].append(market)
 
         cross_market_terms = {
-            term: markets
+            term: tuple(markets)
             for term, markets in all_terms.items()
             if len(markets) > 1
         }
 
         # Update searches with cross-market info
+        if not cross_market_terms:
+            return searches
+
         for search in searches:
-            term_lower = search.term.lower()
-            if term_lower in cross_market_terms:
+            markets = cross_market_terms.get(search.term.lower())
+            if markets is not None:
                 search.is_cross_market = True
-                search.markets_present = cross_market_terms[term_lower]
+                search.markets_present = markets
 
         return searches
 
@@ -448,11 +520,7 @@ class CultureSearchConnector(BaseConnector):
         """Check if Google Trends is accessible."""
         try:
             pytrends = self._get_pytrends()
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: pytrends.trending_searches(pn="south_africa")
-            )
+            result = await self._run_blocking(pytrends.trending_searches, pn="south_africa")
             return result is not None
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
@@ -6,6 +6,7 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 import structlog
+from cachetools import TTLCache
 
 from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
 
@@ -26,6 +27,18 @@ MARKET_GEO_MAP = {
     "MA": "MA",  # Morocco
 }
 
+# Max pytrends requests in flight at once across all markets
+MAX_CONCURRENT_REQUESTS = 4
+
+# Minimum spacing between pytrends request starts, across all markets
+PYTRENDS_REQUEST_INTERVAL_SECONDS = 0.5
+
+# Daily trending lists change a few times a day at most
+DAILY_TRENDS_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Daily trending searches keyed by (geo, UTC date), shared across runs
+_daily_trends_cache: TTLCache = TTLCache(maxsize=64, ttl=DAILY_TRENDS_CACHE_TTL_SECONDS)
+
 
 class GoogleTrendsConnector(BaseConnector):
     """
@@ -43,18 +56,13 @@ class GoogleTrendsConnector(BaseConnector):
 
     def __init__(self, config: dict):
         super().__init__(config)
-        self._pytrends = None
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-    def _get_pytrends(self):
-        """Lazy load pytrends to avoid import errors if not installed."""
-        if self._pytrends is None:
-            try:
-                from pytrends.request import TrendReq
-                self._pytrends = TrendReq(hl="en-US", tz=120)  # GMT+2 for Africa
-            except ImportError:
-                self.logger.error("pytrends not installed")
-                raise
-        return self._pytrends
+    async def _run_pytrends(self, func, *args, **kwargs):
+        """Run a blocking pytrends call in the executor, bounded and rate limited."""
+        async with self._request_semaphore:
+            await self._throttle(PYTRENDS_REQUEST_INTERVAL_SECONDS)
+            return await self._run_blocking(func, *args, **kwargs)
 
     async def fetch(
         self,
@@ -82,22 +90,28 @@ class GoogleTrendsConnector(BaseConnector):
                 errors=["pytrends library not installed"],
             )
 
-        # Fetch daily trending searches per market
+        # Fetch daily trending searches for every market concurrently
+        known_markets = []
         for market in markets:
-            geo = MARKET_GEO_MAP.get(market)
-            if not geo:
+            if MARKET_GEO_MAP.get(market):
+                known_markets.append(market)
+            else:
                 warnings.append(f"Unknown market: {market}")
-                continue
 
-            try:
-                trending_items = await self._fetch_daily_trends(pytrends, geo, market)
-                items.extend(trending_items)
-            except Exception as e:
-                errors.append(f"Error fetching trends for {market}: {str(e)}")
-                self.logger.error("google_trends_fetch_error", market=market, error=str(e))
-
-            # Rate limiting between markets
-            await asyncio.sleep(1)
+        results = await asyncio.gather(
+            *(
+                self._fetch_daily_trends(pytrends, MARKET_GEO_MAP[market], market)
+                for market in known_markets
+            ),
+            return_exceptions=True,
+        )
+
+        for market, trending_items in zip(known_markets, results):
+            if isinstance(trending_items, Exception):
+                errors.append(f"Error fetching trends for {market}: {str(trending_items)}")
+                self.logger.error("google_trends_fetch_error", market=market, error=str(trending_items))
+                continue
+            items.extend(trending_items)
 
         # Fetch interest over time for keywords
         if keywords:
@@ -120,20 +134,24 @@ class GoogleTrendsConnector(BaseConnector):
         items = []
 
         try:
-            # Run in executor since pytrends is synchronous
-            loop = asyncio.get_event_loop()
-            trending = await loop.run_in_executor(
-                None,
-                lambda: pytrends.trending_searches(pn=geo.lower())
-            )
+            cache_key = (geo, datetime.utcnow().date())
+            trending = _daily_trends_cache.get(cache_key)
+            if trending is None:
+                # Run in executor since pytrends is synchronous
+                trending = await self._coalesce(
+                    ("trending_searches", geo),
+                    self._run_pytrends, pytrends.trending_searches, pn=geo.lower()
+                )
+                if trending is not None and not trending.empty:
+                    _daily_trends_cache[cache_key] = trending
 
             if trending is not None and not trending.empty:
-                for idx, row in trending.iterrows():
-                    query = row[0] if isinstance(row, (list, tuple)) else str(row.iloc[0]) if hasattr(row, 'iloc') else str(row)
+                # Queries are in the first column, ranked top down
+                for idx, query in enumerate(trending.iloc[:, 0].tolist()):
                     items.append(TrendItem(
                         id="",  # Will be auto-generated
                         source=self.name,
-                        title=query,
+                        title=str(query),
                         description=f"Trending search in {market}",
                         market=market,
                         volume=100 - idx * 5,  # Rough ranking score
@@ -155,69 +173,101 @@ class GoogleTrendsConnector(BaseConnector):
         keywords: list[str],
         markets: list[str]
     ) -> list[TrendItem]:
-        """Fetch interest over time for specific keywords."""
+        """
+        Fetch interest over time for specific keywords.
+
+        A pytrends session holds the payload of its last build_payload call,
+        so each market gets its own session and markets are fetched
+        concurrently. ``pytrends`` is used for the first market.
+
+        Google Trends matches keywords case-insensitively, so case variants
+        are dropped before batching rather than spending batch slots, and
+        two requests per batch per market, on duplicate series.
+        """
+        unique_keywords = {}
+        for keyword in keywords:
+            unique_keywords.setdefault(keyword.lower(), keyword)
+        keywords = list(unique_keywords.values())
+
+        async def run(market: str, session) -> list[TrendItem]:
+            if session is None:
+                session = await self._run_pytrends(self._create_pytrends)
+            return await self._fetch_market_keyword_interest(session, keywords, market)
+
+        results = await asyncio.gather(
+            *(
+                run(market, pytrends if i == 0 else None)
+                for i, market in enumerate(markets)
+            ),
+            return_exceptions=True,
+        )
+
+        items = []
+        for market, market_items in zip(markets, results):
+            if isinstance(market_items, Exception):
+                self.logger.warning("keyword_interest_error", market=market, error=str(market_items))
+                continue
+            items.extend(market_items)
+        return items
+
+    async def _fetch_market_keyword_interest(
+        self,
+        pytrends,
+        keywords: list[str],
+        market: str
+    ) -> list[TrendItem]:
+        """Fetch interest over time for keywords in a single market."""
         items = []
+        geo = MARKET_GEO_MAP.get(market, "")
 
         # Process keywords in batches of 5 (Google Trends limit)
         for i in range(0, len(keywords), 5):
             batch = keywords[i:i+5]
 
-            for market in markets:
-                geo = MARKET_GEO_MAP.get(market, "")
-
-                try:
-                    loop = asyncio.get_event_loop()
-
-                    # Build payload
-                    await loop.run_in_executor(
-                        None,
-                        lambda b=batch, g=geo: pytrends.build_payload(
-                            b,
-                            cat=0,
-                            timeframe="now 7-d",
-                            geo=g
-                        )
-                    )
-
-                    # Get interest over time
-                    interest = await loop.run_in_executor(
-                        None,
-                        pytrends.interest_over_time
-                    )
-
-                    if interest is not None and not interest.empty:
-                        for keyword in batch:
-                            if keyword in interest.columns:
-                                current = interest[keyword].iloc[-1]
-                                avg = interest[keyword].mean()
-                                velocity = (current - avg) / avg if avg > 0 else 0
-
-                                if velocity > 0.2:  # Only include if above baseline
-                                    items.append(TrendItem(
-                                        id="",
-                                        source=self.name,
-                                        title=keyword,
-                                        description=f"Rising search interest in {market}",
-                                        market=market,
-                                        volume=int(current),
-                                        velocity=velocity,
-                                        metadata={
-                                            "type": "keyword_interest",
-                                            "current_interest": int(current),
-                                            "average_interest": float(avg),
-                                            "geo": geo,
-                                        }
-                                    ))
-
-                except Exception as e:
-                    self.logger.warning(
-                        "keyword_interest_error",
-                        keywords=batch,
-                        market=market,
-                        error=str(e)
-                    )
+            try:
+                # Build payload
+                await self._run_pytrends(
+                    pytrends.build_payload,
+                    batch,
+                    cat=0,
+                    timeframe="now 7-d",
+                    geo=geo
+                )
+
+                # Get interest over time
+                interest = await self._run_pytrends(pytrends.interest_over_time)
+
+                if interest is not None and not interest.empty:
+                    for keyword in batch:
+                        if keyword in interest.columns:
+                            current = interest[keyword].iloc[-1]
+                            avg = interest[keyword].mean()
+                            velocity = (current - avg) / avg if avg > 0 else 0
+
+                            if velocity > 0.2:  # Only include if above baseline
+                                items.append(TrendItem(
+                                    id="",
+                                    source=self.name,
+                                    title=keyword,
+                                    description=f"Rising search interest in {market}",
+                                    market=market,
+                                    volume=int(current),
+                                    velocity=velocity,
+                                    metadata={
+                                        "type": "keyword_interest",
+                                        "current_interest": int(current),
+                                        "average_interest": float(avg),
+                                        "geo": geo,
+                                    }
+                                ))
 
-                await asyncio.sleep(0.5)  # Rate limiting
+            except Exception as e:
+                self.logger.warning(
+                    "keyword_interest_error",
+                    keywords=batch,
+                    market=market,
+                    error=str(e)
+                )
 
         return items
 
@@ -226,11 +276,7 @@ class GoogleTrendsConnector(BaseConnector):
         try:
             pytrends = self._get_pytrends()
             # Simple check - try to get trending for South Africa
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: pytrends.trending_searches(pn="south_africa")
-            )
+            result = await self._run_blocking(pytrends.trending_searches, pn="south_africa")
             return result is not None
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
@@ -3,8 +3,9 @@ News RSS feed connector for tracking African news and media.
 """
 
 import asyncio
+import importlib.util
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 import hashlib
 import structlog
 
@@ -13,6 +14,38 @@ from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
 logger = structlog.get_logger()
 
 
+# Most recent entries kept from each feed
+MAX_FEED_ENTRIES = 50
+
+# Characters of combined title and summary kept as an item's raw_text
+RAW_TEXT_MAX_CHARS = 2000
+
+# Per-feed timeout for health check requests
+HEALTH_CHECK_TIMEOUT_SECONDS = 5
+
+# Place names that tag an article with a market, matched as lowercase substrings
+MARKET_KEYWORDS: Dict[str, tuple[str, ...]] = {
+    "ZA": ("south africa", "johannesburg", "cape town", "pretoria", "durban", "soweto"),
+    "NG": ("nigeria", "lagos", "abuja", "naija"),
+    "KE": ("kenya", "nairobi", "mombasa"),
+    "GH": ("ghana", "accra", "kumasi"),
+    "TZ": ("tanzania", "dar es salaam", "dodoma"),
+    "UG": ("uganda", "kampala"),
+    "AO": ("angola", "luanda"),
+    "CI": ("ivory coast", "côte d'ivoire", "cote d'ivoire", "abidjan"),
+    "SN": ("senegal", "dakar"),
+    "EG": ("egypt", "cairo", "alexandria"),
+    "MA": ("morocco", "rabat", "casablanca", "marrakech"),
+}
+
+
+def _parse_feed_entries(content: bytes) -> list:
+    """Parse raw feed bytes; feedparser sniffs the encoding from them."""
+    import feedparser
+
+    return feedparser.parse(content).entries[:MAX_FEED_ENTRIES]
+
+
 class NewsRSSConnector(BaseConnector):
     """
     Connector for news RSS feeds from African publishers and
@@ -45,26 +78,27 @@ class NewsRSSConnector(BaseConnector):
         errors = []
         warnings = []
 
-        try:
-            import feedparser
-            import aiohttp
-        except ImportError as e:
+        missing = [
+            module for module in ("feedparser", "aiohttp")
+            if importlib.util.find_spec(module) is None
+        ]
+        if missing:
             return self._create_result(
                 items=[],
                 status=SourceStatus.UNAVAILABLE,
-                errors=[f"Required library not installed: {e}"],
+                errors=[f"Required library not installed: {', '.join(missing)}"],
             )
 
         # Create keyword patterns for filtering
-        keyword_set = set(k.lower() for k in keywords) if keywords else set()
+        keyword_set = self._prepare_keywords(keywords)
 
         # Fetch all feeds concurrently
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_feed(session, feed, keyword_set, markets)
-                for feed in self.feeds
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        session = self._get_session()
+        tasks = [
+            self._fetch_feed(session, feed, keyword_set, markets)
+            for feed in self.feeds
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         for result in results:
             if isinstance(result, Exception):
@@ -84,12 +118,10 @@ class NewsRSSConnector(BaseConnector):
         self,
         session,
         feed_config: dict,
-        keywords: set,
+        keywords: tuple[str, ...],
         markets: list[str]
     ) -> list[TrendItem]:
         """Fetch and parse a single RSS feed."""
-        import feedparser
-
         feed_name = feed_config.get("name", "Unknown")
         feed_url = feed_config.get("url")
 
@@ -100,39 +132,37 @@ class NewsRSSConnector(BaseConnector):
         items = []
 
         try:
-            async with session.get(feed_url, timeout=30) as response:
-                if response.status != 200:
-                    self.logger.warning(
-                        "feed_fetch_failed",
-                        feed=feed_name,
-                        status=response.status
-                    )
-                    return []
-
-                content = await response.text()
+            entries = await self._coalesce(
+                ("GET", feed_url), self._load_feed_entries,
+                session, feed_name, feed_url, _parse_feed_entries
+            )
 
-            # Parse feed
-            feed = feedparser.parse(content)
+            # Same for every article in the feed; each item gets its own copy
+            # since the pipeline adds per-item keys to metadata
+            feed_metadata = {
+                "feed_name": feed_name,
+                "feed_url": feed_url,
+                "type": "news_article",
+            }
 
-            for entry in feed.entries[:50]:  # Limit to most recent 50
+            for entry in entries:
                 title = entry.get("title", "")
                 summary = entry.get("summary", entry.get("description", ""))
                 link = entry.get("link", "")
 
-                # Combine text for analysis
-                full_text = f"{title} {summary}".lower()
+                # Combine text for analysis, capped at the stored raw_text length
+                full_text = f"{title} {summary[:RAW_TEXT_MAX_CHARS]}".lower()
 
                 # Filter by keywords if provided
-                if keywords:
-                    matches = [k for k in keywords if k in full_text]
-                    if not matches:
-                        continue
+                if keywords and not any(k in full_text for k in keywords):
+                    continue
 
                 # Parse published date
                 published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                published_parsed = entry.get("published_parsed")
+                if published_parsed:
                     try:
-                        published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                        published = datetime(*published_parsed[:6], tzinfo=timezone.utc)
                     except (TypeError, ValueError):
                         pass
 
@@ -150,14 +180,10 @@ class NewsRSSConnector(BaseConnector):
                     source_url=link,
                     title=title,
                     description=summary[:500] if summary else "",
-                    raw_text=full_text[:2000],
+                    raw_text=full_text[:RAW_TEXT_MAX_CHARS],
                     market=detected_market,
                     published_at=published,
-                    metadata={
-                        "feed_name": feed_name,
-                        "feed_url": feed_url,
-                        "type": "news_article",
-                    }
+                    metadata=feed_metadata.copy(),
                 ))
 
         except asyncio.TimeoutError:
@@ -170,48 +196,45 @@ class NewsRSSConnector(BaseConnector):
     def _detect_market(self, text: str, markets: list[str]) -> Optional[str]:
         """
         Detect which market an article is about based on content.
-        Returns the first matching market or None.
+        Expects already-lowercased text. Returns the first matching market or None.
         """
-        market_keywords = {
-            "ZA": ["south africa", "johannesburg", "cape town", "pretoria", "durban", "soweto"],
-            "NG": ["nigeria", "lagos", "abuja", "naija"],
-            "KE": ["kenya", "nairobi", "mombasa"],
-            "GH": ["ghana", "accra", "kumasi"],
-            "TZ": ["tanzania", "dar es salaam", "dodoma"],
-            "UG": ["uganda", "kampala"],
-            "AO": ["angola", "luanda"],
-            "CI": ["ivory coast", "côte d'ivoire", "cote d'ivoire", "abidjan"],
-            "SN": ["senegal", "dakar"],
-            "EG": ["egypt", "cairo", "alexandria"],
-            "MA": ["morocco", "rabat", "casablanca", "marrakech"],
-        }
-
-        text_lower = text.lower()
-
         for market in markets:
-            if market in market_keywords:
-                if any(kw in text_lower for kw in market_keywords[market]):
-                    return market
+            market_keywords = MARKET_KEYWORDS.get(market)
+            if market_keywords and any(kw in text for kw in market_keywords):
+                return market
 
         return None
 
     async def health_check(self) -> bool:
-        """Check if at least one feed is accessible."""
-        if not self.feeds:
+        """Check if at least half of the feeds are accessible."""
+        feed_urls = [feed["url"] for feed in self.feeds if feed.get("url")]
+        if not feed_urls:
             return False
 
-        try:
-            import aiohttp
+        session = self._get_session()
+        results = await asyncio.gather(
+            *(self._check_feed(session, feed_url) for feed_url in feed_urls),
+            return_exceptions=True,
+        )
+        healthy = sum(1 for result in results if result is True)
+        return healthy >= max(1, len(feed_urls) // 2)
 
-            # Try to fetch the first feed
-            feed_url = self.feeds[0].get("url")
-            if not feed_url:
-                return False
+    async def _check_feed(self, session, feed_url: str) -> bool:
+        """
+        Check one feed with a HEAD request, so the body isn't downloaded.
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url, timeout=10) as response:
+        Falls back to GET for servers that don't allow HEAD.
+        """
+        try:
+            async with session.head(
+                feed_url, timeout=HEALTH_CHECK_TIMEOUT_SECONDS, allow_redirects=True
+            ) as response:
+                if response.status not in (405, 501):
                     return response.status == 200
 
+            async with session.get(feed_url, timeout=HEALTH_CHECK_TIMEOUT_SECONDS) as response:
+                return response.status == 200
+
         except Exception as e:
-            self.logger.error("health_check_failed", error=str(e))
+            self.logger.error("health_check_failed", feed_url=feed_url, error=str(e))
             return False
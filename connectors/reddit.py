@@ -3,6 +3,7 @@ Reddit connector for tracking discussions in Africa-related subreddits.
 """
 
 import asyncio
+import json
 import os
 from datetime import datetime, timezone
 from typing import Optional
@@ -12,6 +13,15 @@ from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
 
 logger = structlog.get_logger()
 
+# Characters of combined title and selftext kept as an item's raw_text
+RAW_TEXT_MAX_CHARS = 2000
+
+# Max JSON API subreddit listings in flight at once
+MAX_CONCURRENT_REQUESTS = 5
+
+# Minimum spacing between unauthenticated JSON API request starts
+JSON_API_REQUEST_INTERVAL_SECONDS = 1.0
+
 
 class RedditConnector(BaseConnector):
     """
@@ -26,11 +36,13 @@ class RedditConnector(BaseConnector):
     name = "reddit"
     display_name = "Reddit"
     requires_auth = False  # Can work without auth via JSON API
+    http_headers = {"User-Agent": "SpotifyAfricaTrends/1.0"}
 
     def __init__(self, config: dict):
         super().__init__(config)
         self.subreddits = config.get("subreddits", [])
         self._praw_reddit = None
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     def _has_credentials(self) -> bool:
         """Check if Reddit API credentials are configured."""
@@ -88,7 +100,12 @@ class RedditConnector(BaseConnector):
         return self._create_result(items, status, errors, warnings)
 
     async def _fetch_with_praw(self, keywords: list[str]) -> list[TrendItem]:
-        """Fetch using authenticated PRAW library."""
+        """
+        Fetch using authenticated PRAW library.
+
+        Subreddits are scanned one at a time: a praw.Reddit instance is not
+        thread-safe, so only one executor thread may use it at once.
+        """
         import praw
 
         items = []
@@ -97,135 +114,202 @@ class RedditConnector(BaseConnector):
         if not reddit:
             return items
 
-        keyword_set = set(k.lower() for k in keywords) if keywords else set()
+        keyword_set = self._prepare_keywords(keywords)
 
         for sub_name in self.subreddits:
-            try:
-                loop = asyncio.get_event_loop()
-                subreddit = await loop.run_in_executor(
-                    None,
-                    lambda s=sub_name: reddit.subreddit(s)
-                )
+            items.extend(
+                await self._fetch_subreddit_praw(reddit, sub_name, keyword_set)
+            )
 
-                # Get hot posts
-                hot_posts = await loop.run_in_executor(
-                    None,
-                    lambda sr=subreddit: list(sr.hot(limit=25))
-                )
+        return items
 
-                for post in hot_posts:
-                    # Filter by keywords if provided
-                    full_text = f"{post.title} {post.selftext}".lower()
-                    if keyword_set and not any(k in full_text for k in keyword_set):
-                        continue
-
-                    items.append(TrendItem(
-                        id=post.id,
-                        source=self.name,
-                        source_url=f"https://reddit.com{post.permalink}",
-                        title=post.title,
-                        description=post.selftext[:500] if post.selftext else "",
-                        raw_text=full_text[:2000],
-                        volume=post.score,
-                        engagement=post.num_comments,
-                        published_at=datetime.fromtimestamp(post.created_utc, tz=timezone.utc),
-                        metadata={
-                            "subreddit": sub_name,
-                            "upvote_ratio": post.upvote_ratio,
-                            "is_self": post.is_self,
-                            "type": "reddit_post",
-                        }
-                    ))
+    async def _fetch_subreddit_praw(
+        self,
+        reddit,
+        sub_name: str,
+        keyword_set: tuple[str, ...]
+    ) -> list[TrendItem]:
+        """Fetch hot posts from one subreddit with PRAW."""
+        items = []
 
-            except Exception as e:
-                self.logger.warning("praw_subreddit_error", subreddit=sub_name, error=str(e))
+        try:
+            hot_posts = await self._run_blocking(
+                self._scan_hot_posts, reddit, sub_name, keyword_set
+            )
+
+            for post in hot_posts:
+                items.append(TrendItem(
+                    id=post["id"],
+                    source=self.name,
+                    source_url=f"https://reddit.com{post['permalink']}",
+                    title=post["title"],
+                    description=post["selftext"][:500] if post["selftext"] else "",
+                    raw_text=post["full_text"][:RAW_TEXT_MAX_CHARS],
+                    volume=post["score"],
+                    engagement=post["num_comments"],
+                    published_at=datetime.fromtimestamp(post["created_utc"], tz=timezone.utc),
+                    metadata={
+                        "subreddit": sub_name,
+                        "upvote_ratio": post["upvote_ratio"],
+                        "is_self": post["is_self"],
+                        "type": "reddit_post",
+                    }
+                ))
+
+        except Exception as e:
+            self.logger.warning("praw_subreddit_error", subreddit=sub_name, error=str(e))
 
         return items
 
+    def _scan_hot_posts(
+        self,
+        reddit,
+        sub_name: str,
+        keyword_set: tuple[str, ...]
+    ) -> list[dict]:
+        """
+        List a subreddit's hot posts that match the keywords.
+
+        Runs in the executor: PRAW pages through the listing while it is
+        iterated, and a Submission may fetch lazily loaded fields on
+        attribute access. Posts are filtered as they stream in, and the
+        fields used for TrendItems are read here into plain dicts so no
+        PRAW attribute access happens on the event loop.
+        """
+        matches = []
+        for post in reddit.subreddit(sub_name).hot(limit=25):
+            title = post.title
+            selftext = post.selftext or ""
+            full_text = f"{title} {selftext[:RAW_TEXT_MAX_CHARS]}".lower()
+            if keyword_set and not any(k in full_text for k in keyword_set):
+                continue
+            matches.append({
+                "id": post.id,
+                "title": title,
+                "selftext": selftext,
+                "full_text": full_text,
+                "permalink": post.permalink,
+                "score": post.score,
+                "num_comments": post.num_comments,
+                "created_utc": post.created_utc,
+                "upvote_ratio": post.upvote_ratio,
+                "is_self": post.is_self,
+            })
+        return matches
+
     async def _fetch_with_json_api(self, keywords: list[str]) -> list[TrendItem]:
         """Fetch using Reddit's public JSON API (no auth required)."""
-        import aiohttp
+        items = []
+        keyword_set = self._prepare_keywords(keywords)
+
+        session = self._get_session()
+        results = await asyncio.gather(
+            *(
+                self._fetch_subreddit_json(session, sub_name, keyword_set)
+                for sub_name in self.subreddits
+            )
+        )
+        for sub_items in results:
+            items.extend(sub_items)
+
+        return items
 
+    async def _fetch_subreddit_json(
+        self,
+        session,
+        sub_name: str,
+        keyword_set: tuple[str, ...]
+    ) -> list[TrendItem]:
+        """Fetch hot posts from one subreddit with the JSON API."""
         items = []
-        keyword_set = set(k.lower() for k in keywords) if keywords else set()
-
-        headers = {
-            "User-Agent": "SpotifyAfricaTrends/1.0"
-        }
-
-        async with aiohttp.ClientSession(headers=headers) as session:
-            for sub_name in self.subreddits:
-                try:
-                    url = f"https://www.reddit.com/r/{sub_name}/hot.json?limit=25"
-
-                    async with session.get(url, timeout=15) as response:
-                        if response.status != 200:
-                            self.logger.warning(
-                                "reddit_api_error",
-                                subreddit=sub_name,
-                                status=response.status
-                            )
-                            continue
-
-                        data = await response.json()
-
-                    posts = data.get("data", {}).get("children", [])
-
-                    for post_wrapper in posts:
-                        post = post_wrapper.get("data", {})
-
-                        title = post.get("title", "")
-                        selftext = post.get("selftext", "")
-                        full_text = f"{title} {selftext}".lower()
-
-                        # Filter by keywords
-                        if keyword_set and not any(k in full_text for k in keyword_set):
-                            continue
-
-                        items.append(TrendItem(
-                            id=post.get("id", ""),
-                            source=self.name,
-                            source_url=f"https://reddit.com{post.get('permalink', '')}",
-                            title=title,
-                            description=selftext[:500],
-                            raw_text=full_text[:2000],
-                            volume=post.get("score", 0),
-                            engagement=post.get("num_comments", 0),
-                            published_at=datetime.fromtimestamp(
-                                post.get("created_utc", 0),
-                                tz=timezone.utc
-                            ),
-                            metadata={
-                                "subreddit": sub_name,
-                                "upvote_ratio": post.get("upvote_ratio", 0),
-                                "type": "reddit_post",
-                            }
-                        ))
-
-                    # Rate limiting
-                    await asyncio.sleep(1)
-
-                except Exception as e:
+
+        try:
+            url = f"https://www.reddit.com/r/{sub_name}/hot.json?limit=25"
+
+            data = await self._coalesce(
+                ("GET", url), self._get_json, session, url, sub_name
+            )
+            if data is None:
+                return items
+
+            posts = data.get("data", {}).get("children", [])
+
+            for post_wrapper in posts:
+                post = post_wrapper.get("data", {})
+
+                title = post.get("title", "")
+                selftext = post.get("selftext", "")
+                full_text = f"{title} {selftext[:RAW_TEXT_MAX_CHARS]}".lower()
+
+                # Filter by keywords
+                if keyword_set and not any(k in full_text for k in keyword_set):
+                    continue
+
+                items.append(TrendItem(
+                    id=post.get("id", ""),
+                    source=self.name,
+                    source_url=f"https://reddit.com{post.get('permalink', '')}",
+                    title=title,
+                    description=selftext[:500],
+                    raw_text=full_text[:RAW_TEXT_MAX_CHARS],
+                    volume=post.get("score", 0),
+                    engagement=post.get("num_comments", 0),
+                    published_at=datetime.fromtimestamp(
+                        post.get("created_utc", 0),
+                        tz=timezone.utc
+                    ),
+                    metadata={
+                        "subreddit": sub_name,
+                        "upvote_ratio": post.get("upvote_ratio", 0),
+                        "type": "reddit_post",
+                    }
+                ))
+
+        except Exception as e:
+            self.logger.warning(
+                "reddit_json_error",
+                subreddit=sub_name,
+                error=str(e)
+            )
+
+        return items
+
+    async def _get_json(self, session, url: str, sub_name: str) -> Optional[dict]:
+        """
+        GET a Reddit JSON listing, returning None on a non-200 response.
+
+        Requests are bounded by the request semaphore and started at most
+        once per JSON_API_REQUEST_INTERVAL_SECONDS, the unauthenticated
+        rate limit.
+        """
+        async with self._request_semaphore:
+            await self._throttle(JSON_API_REQUEST_INTERVAL_SECONDS)
+            async with session.get(url, timeout=15) as response:
+                if response.status != 200:
                     self.logger.warning(
-                        "reddit_json_error",
+                        "reddit_api_error",
                         subreddit=sub_name,
-                        error=str(e)
+                        status=response.status
                     )
+                    return None
 
-        return items
+                # Parse the raw bytes directly rather than via response.json(),
+                # which first decodes the whole body to a str
+                return json.loads(await response.read())
+
+    async def _check_api(self) -> bool:
+        """Request a one-post listing to see if the API answers."""
+        session = self._get_session()
+        async with session.get(
+            "https://www.reddit.com/r/Africa/hot.json?limit=1",
+            timeout=10
+        ) as response:
+            return response.status == 200
 
     async def health_check(self) -> bool:
         """Check if Reddit API is accessible."""
         try:
-            import aiohttp
-
-            headers = {"User-Agent": "SpotifyAfricaTrends/1.0"}
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(
-                    "https://www.reddit.com/r/Africa/hot.json?limit=1",
-                    timeout=10
-                ) as response:
-                    return response.status == 200
+            return await self._coalesce("health_check", self._check_api)
 
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
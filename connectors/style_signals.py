@@ -5,12 +5,19 @@ Aggregates from stable fashion/streetwear RSS feeds with Africa relevance filter
 """
 
 import asyncio
+import functools
 import hashlib
+import heapq
+import html
 import re
+import time
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from typing import List, Optional, Dict, Set
 import aiohttp
 import feedparser
+from lxml import etree
 import structlog
 
 from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
@@ -64,6 +71,17 @@ RSS_FEEDS = {
     },
 }
 
+# Max feeds downloading at once over the connector's shared session
+MAX_CONCURRENT_FEEDS = 6
+
+# Entries parsed from the top of each feed
+MAX_FEED_ENTRIES = 20
+
+# Consecutive entries older than the cutoff after which the rest of a
+# (newest-first) feed is skipped; one stale entry is tolerated in case a
+# feed is slightly out of order
+MAX_CONSECUTIVE_STALE_ENTRIES = 2
+
 # Country relevance keywords
 COUNTRY_KEYWORDS = {
     "NG": [
@@ -112,6 +130,35 @@ SPOTIFY_TAG_PATTERNS = {
     ],
 }
 
+# Each tag's patterns compiled once at import into a single alternation,
+# so a tag costs one search per entry
+COMPILED_SPOTIFY_TAG_PATTERNS = {
+    tag: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    for tag, patterns in SPOTIFY_TAG_PATTERNS.items()
+}
+
+# HTML tags stripped from feed summaries
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Script and style blocks, dropped with their contents like feedparser does
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+# Entry element local names read by the lxml feed parser, mapped to the
+# field they fill (RSS 2.0, RSS 1.0, Atom, content:encoded and dc:date)
+_FEED_ENTRY_FIELDS = {
+    "title": "title",
+    "description": "summary",
+    "summary": "summary",
+    "encoded": "content",
+    "content": "content",
+    "pubDate": "published",
+    "published": "published",
+    "issued": "published",
+    "updated": "updated",
+    "modified": "updated",
+    "date": "updated",
+}
+
 # Risk keywords
 RISK_KEYWORDS = {
     "high": [
@@ -124,6 +171,11 @@ RISK_KEYWORDS = {
 }
 
 
+# Max distinct URLs remembered by the signal ID cache
+SIGNAL_ID_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=SIGNAL_ID_CACHE_SIZE)
 def generate_signal_id(url: str) -> str:
     """Generate unique ID for style signal."""
     return hashlib.sha256(url.encode()).hexdigest()[:16]
@@ -131,44 +183,51 @@ def generate_signal_id(url: str) -> str:
 
 def detect_country_relevance(text: str) -> List[str]:
     """Detect which African markets the content is relevant to."""
-    text_lower = text.lower()
+    return _country_relevance(text.lower())
+
+
+def detect_spotify_tags(text: str) -> List[str]:
+    """Detect Spotify relevance tags."""
+    return _spotify_tags(text.lower())
+
+
+def determine_risk_level(text: str) -> str:
+    """Determine risk level based on content."""
+    return _risk_level(text.lower())
+
+
+def _country_relevance(text_lower: str) -> List[str]:
+    """detect_country_relevance for text that is already lowercased."""
     relevant = []
 
+    # Each country is visited once, so a hit can be appended directly
     for country, keywords in COUNTRY_KEYWORDS.items():
         for keyword in keywords:
             if keyword in text_lower:
-                if country not in relevant:
-                    relevant.append(country)
+                relevant.append(country)
                 break
 
-    # If African source but no specific country, tag all
-    if not relevant:
-        for region_marker in ["africa", "african"]:
-            if region_marker in text_lower:
-                return ["NG", "KE", "GH", "ZA"]
+    # If African source but no specific country, tag all ("africa" also
+    # covers "african")
+    if not relevant and "africa" in text_lower:
+        return ["NG", "KE", "GH", "ZA"]
 
     return relevant
 
 
-def detect_spotify_tags(text: str) -> List[str]:
-    """Detect Spotify relevance tags."""
-    text_lower = text.lower()
+def _spotify_tags(text_lower: str) -> List[str]:
+    """detect_spotify_tags for text that is already lowercased."""
     tags = []
 
-    for tag, patterns in SPOTIFY_TAG_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                if tag not in tags:
-                    tags.append(tag)
-                break
+    for tag, pattern in COMPILED_SPOTIFY_TAG_PATTERNS.items():
+        if pattern.search(text_lower):
+            tags.append(tag)
 
     return tags
 
 
-def determine_risk_level(text: str) -> str:
-    """Determine risk level based on content."""
-    text_lower = text.lower()
-
+def _risk_level(text_lower: str) -> str:
+    """determine_risk_level for text that is already lowercased."""
     for keyword in RISK_KEYWORDS["high"]:
         if keyword in text_lower:
             return "high"
@@ -185,8 +244,8 @@ def extract_summary(entry: dict, max_length: int = 200) -> str:
     # Try to get summary/description
     summary = entry.get("summary", "") or entry.get("description", "")
 
-    # Strip HTML tags
-    summary = re.sub(r"<[^>]+>", "", summary)
+    # Strip HTML tags, then decode entities such as &rsquo; and &nbsp;
+    summary = html.unescape(_HTML_TAG_RE.sub("", summary))
     # Strip extra whitespace
     summary = " ".join(summary.split())
 
@@ -197,6 +256,99 @@ def extract_summary(entry: dict, max_length: int = 200) -> str:
     return summary
 
 
+def parse_feed_entries(content: bytes, limit: Optional[int] = None) -> list:
+    """
+    Parse up to ``limit`` feed entries with lxml, falling back to feedparser.
+
+    Entries are dicts with the keys and value types feedparser gives the
+    fields used here: title, link, summary, published_parsed and
+    updated_parsed (UTC struct_time). feedparser spends most of its time
+    sanitizing HTML and resolving relative URIs, which extract_summary
+    has no use for. Feeds lxml cannot read strictly (including any with
+    HTML named entities), or with no items, still go through feedparser.
+    """
+    entries = _parse_feed_entries_lxml(content, limit)
+    if not entries:
+        return feedparser.parse(content).entries[:limit]
+    return entries
+
+
+def _parse_feed_entries_lxml(content: bytes, limit: Optional[int] = None) -> List[dict]:
+    """Read RSS/Atom entries with lxml; returns [] if the feed can't be read."""
+    entries = []
+
+    # Items are read as they are parsed and released afterwards, and
+    # parsing stops at the limit instead of building the whole tree. The
+    # parser never expands entities or fetches external resources. It is
+    # strict: HTML named entities (&rsquo;, &nbsp;, ...) are not defined in
+    # XML, and a recovering parse silently drops them and mangles the
+    # surrounding text, so malformed feeds and entity references are left
+    # to feedparser instead.
+    items = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=("{*}item", "{*}entry"),
+        no_network=True,
+        resolve_entities=False,
+    )
+    try:
+        for _, item in items:
+            if next(item.iter(etree.Entity), None) is not None:
+                return []
+            entries.append(_read_feed_entry(item))
+            item.clear()
+            if limit is not None and len(entries) >= limit:
+                break
+    except etree.XMLSyntaxError:
+        return []
+
+    return entries
+
+
+def _read_feed_entry(item) -> dict:
+    """Pull the fields used for style signals out of an item/entry element."""
+    fields = {}
+    link = None
+    for child in item:
+        if not isinstance(child.tag, str):  # comments, processing instructions
+            continue
+        name = etree.QName(child).localname
+        if name == "link":
+            # Atom links carry the URL in href; prefer rel="alternate"
+            if link is None and child.get("rel", "alternate") == "alternate":
+                link = child.get("href") or (child.text or "").strip()
+        elif name == "guid":
+            if child.get("isPermaLink", "true") == "true":
+                fields.setdefault("guid", (child.text or "").strip())
+        else:
+            field = _FEED_ENTRY_FIELDS.get(name)
+            if field and field not in fields:
+                fields[field] = "".join(child.itertext()).strip()
+
+    summary = fields.get("summary") or fields.get("content", "")
+    return {
+        "title": fields.get("title", ""),
+        "link": link or fields.get("guid", ""),
+        "summary": _SCRIPT_STYLE_RE.sub("", summary),
+        "published_parsed": _parse_feed_date(fields.get("published")),
+        "updated_parsed": _parse_feed_date(fields.get("updated")),
+    }
+
+
+def _parse_feed_date(value: Optional[str]) -> Optional[time.struct_time]:
+    """Parse an RFC 822 or ISO 8601 feed date to a UTC struct_time."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return parsed.utctimetuple()
+
+
 class StyleSignalsConnector(BaseConnector):
     """
     Connector for streetwear/fashion style signals via RSS.
@@ -214,6 +366,7 @@ class StyleSignalsConnector(BaseConnector):
 
     def __init__(self, config: dict):
         super().__init__(config)
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
         self.feeds = {**RSS_FEEDS}
         # Allow config to add/override feeds
         config_feeds = config.get("style_signals", {}).get("feeds", [])
@@ -270,105 +423,104 @@ class StyleSignalsConnector(BaseConnector):
             limit: Maximum number of signals to return
         """
         all_signals: List[StyleSignal] = []
-        cutoff_date = datetime.utcnow() - timedelta(days=7)
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=7)
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for feed_key, feed_info in self.feeds.items():
-                tasks.append(self._fetch_feed(session, feed_key, feed_info, cutoff_date))
+        session = self._get_session()
+        tasks = []
+        for feed_key, feed_info in self.feeds.items():
+            tasks.append(self._fetch_feed(session, feed_key, feed_info, cutoff_date, now))
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception):
-                    self.logger.warning("feed_fetch_error", error=str(result))
-                    continue
-                all_signals.extend(result)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Filter by market relevance if specified
-        if markets:
-            all_signals = [
-                s for s in all_signals
-                if any(m in s.country_relevance for m in markets) or not s.country_relevance
-            ]
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning("feed_fetch_error", error=str(result))
+                continue
+            all_signals.extend(result)
 
-        # Filter by risk level
+        # Filter by market relevance and risk level
         risk_order = {"low": 1, "medium": 2, "high": 3}
         max_risk_value = risk_order.get(max_risk, 3)
-        all_signals = [
+        candidates = (
             s for s in all_signals
-            if risk_order.get(s.risk_level, 1) <= max_risk_value
-        ]
-
-        # Sort by publish date (newest first) and limit
-        all_signals.sort(key=lambda x: x.publish_date, reverse=True)
-
-        # Prioritize Africa-relevant signals
-        africa_signals = [s for s in all_signals if s.country_relevance]
-        global_signals = [s for s in all_signals if not s.country_relevance]
-
-        # Return mix: prioritize Africa, fill with global
-        result = africa_signals[:limit]
-        remaining = limit - len(result)
-        if remaining > 0:
-            result.extend(global_signals[:remaining])
-
-        return result[:limit]
+            if (not markets or not s.country_relevance
+                or any(m in s.country_relevance for m in markets))
+            and risk_order.get(s.risk_level, 1) <= max_risk_value
+        )
+
+        # Newest first, Africa-relevant signals ahead of global ones
+        return heapq.nlargest(
+            limit,
+            candidates,
+            key=lambda x: (bool(x.country_relevance), x.publish_date),
+        )
 
     async def _fetch_feed(
         self,
         session: aiohttp.ClientSession,
         feed_key: str,
         feed_info: dict,
-        cutoff_date: datetime
+        cutoff_date: datetime,
+        now: Optional[datetime] = None,
     ) -> List[StyleSignal]:
-        """Fetch and parse a single RSS feed."""
+        """
+        Fetch and parse a single RSS feed.
+
+        ``now`` stamps collected_at and dates undated entries; it defaults
+        to the current time.
+        """
         signals = []
         url = feed_info["url"]
         source_name = feed_info["name"]
+        if now is None:
+            now = datetime.utcnow()
 
         try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status != 200:
-                    self.logger.warning("feed_http_error", feed=feed_key, status=response.status)
-                    return []
-
-                content = await response.text()
-
-            # Parse feed
-            feed = feedparser.parse(content)
+            async with self._fetch_semaphore:
+                entries = await self._load_feed_entries(
+                    session, feed_key, url,
+                    functools.partial(parse_feed_entries, limit=MAX_FEED_ENTRIES),
+                )
 
-            for entry in feed.entries[:20]:  # Limit entries per feed
+            stale_entries = 0
+            for entry in entries:
                 # Parse publish date
                 published = entry.get("published_parsed") or entry.get("updated_parsed")
                 if published:
                     publish_date = datetime(*published[:6])
                 else:
-                    publish_date = datetime.utcnow()
+                    publish_date = now
 
-                # Skip old entries
+                # Skip old entries; feeds list newest first, so stop once
+                # the cutoff has clearly been crossed
                 if publish_date < cutoff_date:
+                    stale_entries += 1
+                    if stale_entries >= MAX_CONSECUTIVE_STALE_ENTRIES:
+                        break
                     continue
+                stale_entries = 0
 
                 title = entry.get("title", "")
                 link = entry.get("link", "")
                 summary = extract_summary(entry)
 
-                # Combine title and summary for analysis
-                full_text = f"{title} {summary}"
+                # Combine title and summary for analysis, lowercased once
+                # for all three detectors
+                full_text = f"{title} {summary}".lower()
 
                 # Detect country relevance
-                country_relevance = detect_country_relevance(full_text)
+                country_relevance = _country_relevance(full_text)
 
                 # For Africa-focused sources, assume relevance if none detected
                 if not country_relevance and feed_info.get("region") == "africa":
                     country_relevance = ["NG", "KE", "GH", "ZA"]
 
                 # Detect Spotify tags
-                spotify_tags = detect_spotify_tags(full_text)
+                spotify_tags = _spotify_tags(full_text)
 
                 # Determine risk level
-                risk_level = determine_risk_level(full_text)
+                risk_level = _risk_level(full_text)
 
                 signal = StyleSignal(
                     id=generate_signal_id(link),
@@ -380,7 +532,7 @@ class StyleSignalsConnector(BaseConnector):
                     country_relevance=country_relevance,
                     spotify_tags=spotify_tags,
                     risk_level=risk_level,
-                    collected_at=datetime.utcnow(),
+                    collected_at=now,
                 )
                 signals.append(signal)
 
@@ -394,14 +546,14 @@ class StyleSignalsConnector(BaseConnector):
     async def health_check(self) -> bool:
         """Check if at least one feed is accessible."""
         try:
-            async with aiohttp.ClientSession() as session:
-                # Try to fetch one feed
-                feed_info = list(self.feeds.values())[0]
-                async with session.get(
-                    feed_info["url"],
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    return response.status == 200
+            session = self._get_session()
+            # Try to fetch one feed
+            feed_info = list(self.feeds.values())[0]
+            async with session.get(
+                feed_info["url"],
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                return response.status == 200
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
             return False
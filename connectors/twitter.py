@@ -6,15 +6,34 @@ the interface but requires valid API credentials to function.
 """
 
 import asyncio
+import json
 import os
+import time
 from datetime import datetime, timezone
 from typing import Optional
+import aiohttp
 import structlog
 
 from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
 
 logger = structlog.get_logger()
 
+# Max recent-search requests in flight at once; per-window rate limits are
+# handled by waiting out 429 responses
+MAX_CONCURRENT_SEARCHES = 3
+
+# Keywords searched per fetch, to preserve the recent-search quota
+MAX_SEARCH_KEYWORDS = 10
+
+# Twitter API v2 recent search endpoint
+RECENT_SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+
+# Retries of a rate-limited (429) search, and the most time spent waiting
+# for rate limit windows to reset, before the search fails instead of
+# stalling the run until the 15-minute window resets
+MAX_RATE_LIMIT_RETRIES = 2
+MAX_RATE_LIMIT_WAIT_SECONDS = 60
+
 
 class TwitterConnector(BaseConnector):
     """
@@ -35,6 +54,7 @@ class TwitterConnector(BaseConnector):
     def __init__(self, config: dict):
         super().__init__(config)
         self._client = None
+        self._search_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
 
     def _has_credentials(self) -> bool:
         """Check if Twitter API credentials are configured."""
@@ -43,18 +63,26 @@ class TwitterConnector(BaseConnector):
         ])
 
     def _get_client(self):
-        """Get authenticated Twitter client."""
-        if self._client is None and self._has_credentials():
-            try:
-                import tweepy
-                self._client = tweepy.Client(
-                    bearer_token=os.getenv("TWITTER_BEARER_TOKEN"),
-                    wait_on_rate_limit=True
-                )
-            except ImportError:
-                self.logger.error("tweepy not installed")
+        """Get the tweepy client used as a fallback for direct requests."""
+        if self._client is None:
+            import tweepy
+            # Rate limits surface as errors, as on the direct path, rather
+            # than blocking a worker thread until the window resets
+            self._client = tweepy.Client(
+                bearer_token=os.getenv("TWITTER_BEARER_TOKEN"),
+                wait_on_rate_limit=False,
+            )
         return self._client
 
+    @staticmethod
+    def _tweepy_available() -> bool:
+        """Check that tweepy can be imported."""
+        try:
+            import tweepy  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
     async def fetch(
         self,
         markets: list[str],
@@ -79,64 +107,19 @@ class TwitterConnector(BaseConnector):
                 ],
             )
 
-        client = self._get_client()
-        if not client:
-            return self._create_result(
-                items=[],
-                status=SourceStatus.UNAVAILABLE,
-                errors=["Failed to initialize Twitter client. Is tweepy installed?"],
-            )
+        # Search for keywords concurrently, keeping results in keyword order
+        search_keywords = keywords[:MAX_SEARCH_KEYWORDS]
+        results = await asyncio.gather(
+            *(self._search_keyword(keyword) for keyword in search_keywords),
+            return_exceptions=True,
+        )
 
-        loop = asyncio.get_event_loop()
-
-        # Search for keywords
-        for keyword in keywords[:10]:  # Limit to preserve rate limits
-            try:
-                # Run search in executor since tweepy is synchronous
-                tweets = await loop.run_in_executor(
-                    None,
-                    lambda k=keyword: client.search_recent_tweets(
-                        query=f"{k} -is:retweet lang:en",
-                        max_results=50,
-                        tweet_fields=["created_at", "public_metrics", "lang", "geo"],
-                        expansions=["author_id"],
-                        user_fields=["name", "username", "public_metrics"]
-                    )
-                )
-
-                if tweets.data:
-                    for tweet in tweets.data:
-                        metrics = tweet.public_metrics or {}
-                        items.append(TrendItem(
-                            id=str(tweet.id),
-                            source=self.name,
-                            source_url=f"https://twitter.com/i/web/status/{tweet.id}",
-                            title=tweet.text[:100],
-                            description=tweet.text,
-                            raw_text=tweet.text,
-                            language=tweet.lang,
-                            volume=metrics.get("impression_count", 0),
-                            engagement=(
-                                metrics.get("like_count", 0) +
-                                metrics.get("retweet_count", 0) +
-                                metrics.get("reply_count", 0)
-                            ),
-                            published_at=tweet.created_at,
-                            metadata={
-                                "type": "tweet",
-                                "search_query": keyword,
-                                "like_count": metrics.get("like_count", 0),
-                                "retweet_count": metrics.get("retweet_count", 0),
-                                "reply_count": metrics.get("reply_count", 0),
-                            }
-                        ))
-
-            except Exception as e:
-                errors.append(f"Search error for '{keyword}': {e}")
-                self.logger.error("twitter_search_error", keyword=keyword, error=str(e))
-
-            # Rate limiting
-            await asyncio.sleep(1)
+        for keyword, keyword_items in zip(search_keywords, results):
+            if isinstance(keyword_items, Exception):
+                errors.append(f"Search error for '{keyword}': {keyword_items}")
+                self.logger.error("twitter_search_error", keyword=keyword, error=str(keyword_items))
+                continue
+            items.extend(keyword_items)
 
         status = SourceStatus.ACTIVE if items else SourceStatus.DEGRADED
         if errors and not items:
@@ -144,26 +127,123 @@ class TwitterConnector(BaseConnector):
 
         return self._create_result(items, status, errors, warnings)
 
+    async def _search_recent(self, query: str, max_results: int = 50) -> dict:
+        """
+        Call the recent search endpoint on the shared HTTP session.
+
+        A 429 waits until the rate limit window resets (from
+        x-rate-limit-reset) and retries, up to MAX_RATE_LIMIT_RETRIES times
+        and MAX_RATE_LIMIT_WAIT_SECONDS in total; past either limit the
+        search raises RuntimeError.
+        """
+        session = self._get_session()
+        params = {
+            "query": query,
+            "max_results": max_results,
+            "tweet.fields": "created_at,public_metrics,lang,geo",
+        }
+        headers = self._auth_headers()
+
+        waited = 0.0
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            async with session.get(RECENT_SEARCH_URL, params=params, headers=headers) as response:
+                if response.status == 200:
+                    return json.loads(await response.read())
+                if response.status != 429:
+                    raise RuntimeError(f"Twitter API returned {response.status}")
+                reset_at = int(response.headers.get("x-rate-limit-reset", 0))
+                wait = max(reset_at - time.time(), 0) + 1
+
+            if attempt == MAX_RATE_LIMIT_RETRIES or waited + wait > MAX_RATE_LIMIT_WAIT_SECONDS:
+                raise RuntimeError(
+                    f"Twitter API rate limited; window resets in {round(wait)}s"
+                )
+            self.logger.warning("twitter_rate_limited", wait_seconds=round(wait))
+            waited += wait
+            await asyncio.sleep(wait)
+
+    def _search_recent_tweepy(self, query: str, max_results: int = 50) -> dict:
+        """
+        Run the recent search through tweepy (blocking).
+
+        Returns the same shape as _search_recent: each tweepy Tweet keeps
+        the raw API object in ``data``.
+        """
+        response = self._get_client().search_recent_tweets(
+            query=query,
+            max_results=max_results,
+            tweet_fields=["created_at", "public_metrics", "lang", "geo"],
+        )
+        return {"data": [tweet.data for tweet in response.data or []]}
+
+    def _auth_headers(self) -> dict:
+        """Bearer token header for Twitter API requests."""
+        return {"Authorization": f"Bearer {os.getenv('TWITTER_BEARER_TOKEN')}"}
+
+    async def _search_keyword(self, keyword: str) -> list[TrendItem]:
+        """Search recent tweets for a keyword."""
+        query = f"{keyword} -is:retweet lang:en"
+        async with self._search_semaphore:
+            try:
+                body = await self._search_recent(query)
+            except aiohttp.ClientError as e:
+                # Connection-level failure on the direct path; retry through
+                # tweepy when it is installed
+                if not self._tweepy_available():
+                    raise
+                self.logger.warning("twitter_tweepy_fallback", keyword=keyword, error=str(e))
+                body = await self._run_blocking(self._search_recent_tweepy, query)
+
+        items = []
+        for tweet in body.get("data", []):
+            metrics = tweet.get("public_metrics") or {}
+            like_count = metrics.get("like_count", 0)
+            retweet_count = metrics.get("retweet_count", 0)
+            reply_count = metrics.get("reply_count", 0)
+            text = tweet.get("text", "")
+            created_at = tweet.get("created_at")
+            items.append(TrendItem(
+                id=tweet["id"],
+                source=self.name,
+                source_url=f"https://twitter.com/i/web/status/{tweet['id']}",
+                title=text[:100],
+                description=text,
+                raw_text=text,
+                language=tweet.get("lang"),
+                volume=metrics.get("impression_count", 0),
+                engagement=like_count + retweet_count + reply_count,
+                published_at=datetime.fromisoformat(created_at) if created_at else None,
+                metadata={
+                    "type": "tweet",
+                    "search_query": keyword,
+                    "like_count": like_count,
+                    "retweet_count": retweet_count,
+                    "reply_count": reply_count,
+                }
+            ))
+        return items
+
+    async def _check_api(self) -> bool:
+        """
+        Run a minimal search to see if the API answers.
+
+        A 429 means the token is valid and the API reachable, so it counts
+        as healthy rather than waiting out the rate limit window.
+        """
+        session = self._get_session()
+        params = {"query": "test", "max_results": 10}
+        async with session.get(
+            RECENT_SEARCH_URL, params=params, headers=self._auth_headers(), timeout=10
+        ) as response:
+            return response.status in (200, 429)
+
     async def health_check(self) -> bool:
         """Check if Twitter API is accessible."""
         if not self._has_credentials():
             return False
 
-        client = self._get_client()
-        if not client:
-            return False
-
         try:
-            loop = asyncio.get_event_loop()
-            # Simple test query
-            result = await loop.run_in_executor(
-                None,
-                lambda: client.search_recent_tweets(
-                    query="test",
-                    max_results=10
-                )
-            )
-            return result is not None
+            return await self._check_api()
 
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
@@ -3,14 +3,58 @@ Wikipedia pageviews connector for tracking interest spikes in artists and events
 """
 
 import asyncio
+import importlib.util
+import json
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+import numpy as np
 import structlog
 
 from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
 
 logger = structlog.get_logger()
 
+# Latest-day growth over the baseline that counts as a spike
+SPIKE_VELOCITY = 0.5
+
+# Titles per MediaWiki Action API pageviews query (the API's limit)
+PAGEVIEWS_BATCH_SIZE = 50
+
+# Days of pageviews requested from the Action API
+PAGEVIEWS_DAYS = 7
+
+
+def _pageview_stats(series: list[list[int]]):
+    """
+    Compute pageview metrics for many pages at once.
+
+    Each page's daily views are packed into one zero-padded 2D array, so
+    totals, averages and spike velocity come out of a few array
+    operations instead of per-page Python arithmetic. The baseline is the
+    average of every day before the latest one, or the overall average
+    for a single-day series.
+
+    Returns:
+        (total, average, latest, velocity) arrays, one entry per series
+    """
+    lengths = np.fromiter(map(len, series), dtype=np.int64, count=len(series))
+    views = np.zeros((len(series), int(lengths.max())), dtype=np.int64)
+    for row, daily in enumerate(series):
+        views[row, :len(daily)] = daily
+
+    total = views.sum(axis=1)
+    average = total / lengths
+    latest = views[np.arange(len(series)), lengths - 1]
+
+    earlier_days = lengths - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        baseline = np.where(
+            earlier_days > 0, (total - latest) / np.maximum(earlier_days, 1), average
+        )
+        velocity = np.where(baseline > 0, (latest - baseline) / baseline, 0.0)
+
+    return total, average, latest, velocity
+
 
 class WikipediaConnector(BaseConnector):
     """
@@ -30,6 +74,7 @@ class WikipediaConnector(BaseConnector):
     requires_auth = False
 
     WIKIMEDIA_API = "https://wikimedia.org/api/rest_v1"
+    ACTION_API = "https://en.wikipedia.org/w/api.php"
 
     def __init__(self, config: dict):
         super().__init__(config)
@@ -69,9 +114,7 @@ class WikipediaConnector(BaseConnector):
             )
 
         # Fetch pageviews for each page
-        try:
-            import aiohttp
-        except ImportError:
+        if importlib.util.find_spec("aiohttp") is None:
             return self._create_result(
                 items=[],
                 status=SourceStatus.UNAVAILABLE,
@@ -82,18 +125,52 @@ class WikipediaConnector(BaseConnector):
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=7)
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_pageviews(session, page, start_date, end_date)
-                for page in pages_to_check[:100]  # Limit to avoid overwhelming API
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        session = self._get_session()
+        pages = pages_to_check[:100]  # Limit to avoid overwhelming API
+
+        # Query pageviews up to 50 titles at a time through the Action API
+        batchable = list(dict.fromkeys(page for page in pages if "|" not in page))
+        batches = [
+            batchable[i:i + PAGEVIEWS_BATCH_SIZE]
+            for i in range(0, len(batchable), PAGEVIEWS_BATCH_SIZE)
+        ]
+        batch_results = await asyncio.gather(
+            *(self._fetch_pageviews_batch(session, batch) for batch in batches),
+            return_exceptions=True,
+        )
 
-        for result in results:
+        views_by_title = {}
+        for result in batch_results:
+            if isinstance(result, Exception):
+                self.logger.warning("pageview_batch_error", error=str(result))
+            else:
+                views_by_title.update(result)
+
+        # Titles the batches didn't answer fall back to one REST call each
+        fallback = list(dict.fromkeys(page for page in pages if page not in views_by_title))
+        results = await asyncio.gather(
+            *(
+                self._fetch_pageviews(session, page, start_date, end_date)
+                for page in fallback
+            ),
+            return_exceptions=True,
+        )
+        for page_title, result in zip(fallback, results):
             if isinstance(result, Exception):
                 self.logger.warning("pageview_fetch_error", error=str(result))
-            elif result:
-                items.append(result)
+                result = None
+            views_by_title[page_title] = result
+
+        titles = []
+        series = []
+        for page_title in pages:
+            views = views_by_title[page_title]
+            if views:
+                titles.append(page_title)
+                series.append(views)
+
+        if series:
+            items.extend(self._build_pageview_items(titles, series))
 
         status = SourceStatus.ACTIVE if items else SourceStatus.DEGRADED
         return self._create_result(items, status, errors, warnings)
@@ -104,8 +181,8 @@ class WikipediaConnector(BaseConnector):
         page_title: str,
         start_date: datetime,
         end_date: datetime
-    ) -> Optional[TrendItem]:
-        """Fetch pageview data for a single Wikipedia page."""
+    ) -> Optional[list[int]]:
+        """Fetch daily pageviews for a single Wikipedia page."""
 
         # Format dates for API (YYYYMMDD)
         start = start_date.strftime("%Y%m%d")
@@ -127,49 +204,115 @@ class WikipediaConnector(BaseConnector):
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = json.loads(await response.read())
 
             items = data.get("items", [])
             if not items:
                 return None
 
-            # Calculate metrics
-            views = [item.get("views", 0) for item in items]
-            total_views = sum(views)
-            avg_views = total_views / len(views) if views else 0
-            latest_views = views[-1] if views else 0
+            return [item.get("views", 0) for item in items]
 
-            # Calculate velocity (spike detection)
-            baseline = sum(views[:-1]) / len(views[:-1]) if len(views) > 1 else avg_views
-            velocity = (latest_views - baseline) / baseline if baseline > 0 else 0
+        except asyncio.TimeoutError:
+            self.logger.warning("pageview_timeout", page=page_title)
+            return None
+        except Exception as e:
+            self.logger.warning("pageview_error", page=page_title, error=str(e))
+            return None
 
-            # Only include if above threshold or spiking
-            if total_views < self.pageview_threshold and velocity < 0.5:
-                return None
+    async def _fetch_pageviews_batch(
+        self,
+        session,
+        titles: list[str]
+    ) -> dict[str, Optional[list[int]]]:
+        """
+        Fetch daily pageviews for up to 50 pages in one Action API query.
+
+        Returns views by requested title; None for pages that don't exist.
+        Titles the API didn't return pageviews for are left out so the
+        caller can fall back to the per-article REST endpoint.
+        """
+        params = {
+            "action": "query",
+            "prop": "pageviews",
+            "titles": "|".join(titles),
+            "pvipdays": str(PAGEVIEWS_DAYS),
+            "format": "json",
+            "formatversion": "2",
+        }
+
+        pages = {}
+        normalized = {}
+        while True:
+            async with session.get(self.ACTION_API, params=params, timeout=15) as response:
+                if response.status != 200:
+                    break
+                data = json.loads(await response.read())
+
+            query = data.get("query", {})
+            for entry in query.get("normalized", []):
+                normalized[entry["from"]] = entry["to"]
+            for page in query.get("pages", []):
+                # Continuations return each page again, with pageviews only
+                # for the pages that batch covered
+                known = pages.setdefault(page["title"], page)
+                if "pageviews" in page:
+                    known["pageviews"] = page["pageviews"]
+
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+        views_by_title = {}
+        for title in titles:
+            page = pages.get(normalized.get(title, title))
+            if page is None:
+                continue
+            if page.get("missing") or page.get("invalid"):
+                views_by_title[title] = None
+            elif "pageviews" in page:
+                daily = page["pageviews"]
+                views_by_title[title] = [
+                    daily[day] for day in sorted(daily) if daily[day] is not None
+                ]
+
+        return views_by_title
+
+    def _build_pageview_items(
+        self,
+        titles: list[str],
+        series: list[list[int]]
+    ) -> list[TrendItem]:
+        """Build items for pages above the view threshold or spiking."""
+        items = []
+        total, average, latest, velocity = _pageview_stats(series)
+
+        # Only include if above threshold or spiking
+        keep = (total >= self.pageview_threshold) | (velocity >= SPIKE_VELOCITY)
+
+        for i in np.flatnonzero(keep):
+            page_title = titles[i]
+            page_url = page_title.replace(" ", "_")
+            total_views = int(total[i])
+            page_velocity = float(velocity[i])
 
-            return TrendItem(
+            items.append(TrendItem(
                 id=f"wiki_{page_url}",
                 source=self.name,
                 source_url=f"https://en.wikipedia.org/wiki/{page_url}",
                 title=page_title,
                 description=f"Wikipedia page with {total_views:,} views in 7 days",
                 volume=total_views,
-                velocity=velocity,
+                velocity=page_velocity,
                 metadata={
                     "type": "wikipedia_pageviews",
-                    "daily_views": views,
-                    "average_daily": round(avg_views),
-                    "latest_daily": latest_views,
-                    "spike_detected": velocity > 0.5,
+                    "daily_views": series[i],
+                    "average_daily": round(float(average[i])),
+                    "latest_daily": int(latest[i]),
+                    "spike_detected": page_velocity > SPIKE_VELOCITY,
                 }
-            )
+            ))
 
-        except asyncio.TimeoutError:
-            self.logger.warning("pageview_timeout", page=page_title)
-            return None
-        except Exception as e:
-            self.logger.warning("pageview_error", page=page_title, error=str(e))
-            return None
+        return items
 
     async def get_trending_pages(
         self,
@@ -181,8 +324,6 @@ class WikipediaConnector(BaseConnector):
 
         This can be used to discover new trending topics.
         """
-        import aiohttp
-
         if date is None:
             date = datetime.now(timezone.utc) - timedelta(days=1)
 
@@ -198,12 +339,12 @@ class WikipediaConnector(BaseConnector):
         items = []
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=15) as response:
-                    if response.status != 200:
-                        return items
+            session = self._get_session()
+            async with session.get(url, timeout=15) as response:
+                if response.status != 200:
+                    return items
 
-                    data = await response.json()
+                data = json.loads(await response.read())
 
             articles = data.get("items", [{}])[0].get("articles", [])
 
@@ -237,14 +378,12 @@ class WikipediaConnector(BaseConnector):
     async def health_check(self) -> bool:
         """Check if Wikipedia API is accessible."""
         try:
-            import aiohttp
-
             # Check API status
             url = f"{self.WIKIMEDIA_API}/metrics/pageviews/top/en.wikipedia/all-access/2024/01/01"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    return response.status == 200
+            session = self._get_session()
+            async with session.get(url, timeout=10) as response:
+                return response.status == 200
 
         except Exception as e:
             self.logger.error("health_check_failed", error=str(e))
@@ -3,10 +3,12 @@ YouTube connector for tracking trending videos and music content in Africa.
 """
 
 import asyncio
+import json
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import structlog
+from cachetools import TTLCache
 
 from .base import BaseConnector, ConnectorResult, TrendItem, SourceStatus
 
@@ -27,6 +29,45 @@ MARKET_REGION_MAP = {
     "MA": "MA",
 }
 
+# YouTube Data API v3 REST endpoint
+API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# Max Data API requests in flight at once across markets and keywords
+MAX_CONCURRENT_REQUESTS = 8
+
+# Keywords searched per fetch; each search costs 100 quota units
+MAX_SEARCH_KEYWORDS = 20
+
+# Keyword searches only return videos published within this window
+SEARCH_WINDOW = timedelta(days=7)
+
+# Partial responses: only the fields read when building TrendItems
+_SNIPPET_FIELDS = "snippet(title,description,publishedAt,channelTitle,channelId)"
+_STATISTICS_FIELDS = "statistics(viewCount,likeCount,commentCount)"
+TRENDING_FIELDS = f"items(id,{_SNIPPET_FIELDS},{_STATISTICS_FIELDS})"
+SEARCH_FIELDS = f"items(id/videoId,{_SNIPPET_FIELDS})"
+VIDEO_STATS_FIELDS = f"items(id,{_STATISTICS_FIELDS})"
+
+# Video IDs per videos.list call (the API maximum); a call costs 1 unit
+VIDEOS_LIST_BATCH_SIZE = 50
+
+# How long API responses are reused; the Data API allows 10,000 quota
+# units a day, and a full fetch spends about 2,000
+TRENDING_CACHE_TTL_SECONDS = 60 * 60
+SEARCH_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Raw API responses, shared across runs: trending charts keyed by region,
+# searches by (keyword, max_results, published_after). Items are rebuilt from them on each
+# fetch, since the pipeline annotates TrendItems in place
+_trending_cache: TTLCache = TTLCache(maxsize=64, ttl=TRENDING_CACHE_TTL_SECONDS)
+_search_cache: TTLCache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL_SECONDS)
+
+
+def _search_published_after() -> str:
+    """Start of the keyword search window: UTC midnight SEARCH_WINDOW ago."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (today - SEARCH_WINDOW).isoformat()
+
 
 class YouTubeConnector(BaseConnector):
     """
@@ -44,24 +85,22 @@ class YouTubeConnector(BaseConnector):
 
     def __init__(self, config: dict):
         super().__init__(config)
-        self._youtube = None
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     def _has_credentials(self) -> bool:
         """Check if YouTube API key is configured."""
         return bool(os.getenv("YOUTUBE_API_KEY"))
 
-    def _get_youtube(self):
-        """Get YouTube API client."""
-        if self._youtube is None and self._has_credentials():
-            try:
-                from googleapiclient.discovery import build
-                self._youtube = build(
-                    "youtube", "v3",
-                    developerKey=os.getenv("YOUTUBE_API_KEY")
-                )
-            except ImportError:
-                self.logger.error("google-api-python-client not installed")
-        return self._youtube
+    async def _get(self, resource: str, **params) -> dict:
+        """GET a Data API resource (videos, search, ...) on the shared session."""
+        session = self._get_session()
+        params["key"] = os.getenv("YOUTUBE_API_KEY")
+
+        async with self._request_semaphore:
+            async with session.get(f"{API_BASE_URL}/{resource}", params=params) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"YouTube API returned {response.status}")
+                return json.loads(await response.read())
 
     async def fetch(
         self,
@@ -83,164 +122,218 @@ class YouTubeConnector(BaseConnector):
                 warnings=["YOUTUBE_API_KEY not configured"],
             )
 
-        youtube = self._get_youtube()
-        if not youtube:
-            return self._create_result(
-                items=[],
-                status=SourceStatus.UNAVAILABLE,
-                errors=["Failed to initialize YouTube client"],
-            )
+        # Fetch trending videos per market and search keywords concurrently
+        trending_markets = [m for m in markets if MARKET_REGION_MAP.get(m)]
+        search_keywords = (keywords or [])[:MAX_SEARCH_KEYWORDS]
+        published_after = _search_published_after()
+        results = await asyncio.gather(
+            *(
+                self._fetch_trending(MARKET_REGION_MAP[market], market)
+                for market in trending_markets
+            ),
+            *(self._search_videos(keyword, published_after) for keyword in search_keywords),
+            return_exceptions=True,
+        )
+        trending_results = results[:len(trending_markets)]
+        search_results = results[len(trending_markets):]
+
+        for market, trending_items in zip(trending_markets, trending_results):
+            if isinstance(trending_items, Exception):
+                errors.append(f"Error fetching trends for {market}: {trending_items}")
+                self.logger.error("youtube_trending_error", market=market, error=str(trending_items))
+                continue
+            items.extend(trending_items)
 
-        # Fetch trending videos per market
-        for market in markets:
-            region = MARKET_REGION_MAP.get(market)
-            if not region:
+        found_items = []
+        for keyword, search_items in zip(search_keywords, search_results):
+            if isinstance(search_items, Exception):
+                errors.append(f"Error searching for '{keyword}': {search_items}")
+                self.logger.warning("youtube_search_error", keyword=keyword, error=str(search_items))
                 continue
+            found_items.extend(search_items)
 
-            try:
-                trending_items = await self._fetch_trending(youtube, region, market)
-                items.extend(trending_items)
-            except Exception as e:
-                errors.append(f"Error fetching trends for {market}: {e}")
-                self.logger.error("youtube_trending_error", market=market, error=str(e))
-
-        # Search for keywords
-        if keywords:
-            for keyword in keywords[:20]:  # Limit to avoid quota exhaustion
-                try:
-                    search_items = await self._search_videos(youtube, keyword)
-                    items.extend(search_items)
-                except Exception as e:
-                    self.logger.warning("youtube_search_error", keyword=keyword, error=str(e))
-
-        status = SourceStatus.ACTIVE if items else SourceStatus.DEGRADED
+        # Search results carry no statistics; look them up for every
+        # keyword's videos at once
+        if found_items:
+            video_stats = await self._hydrate_videos(
+                list(dict.fromkeys(item.id for item in found_items if item.id))
+            )
+            for item in found_items:
+                stats = video_stats.get(item.id)
+                if stats is None:
+                    continue
+                view_count = int(stats.get("viewCount", 0))
+                like_count = int(stats.get("likeCount", 0))
+                comment_count = int(stats.get("commentCount", 0))
+                item.volume = view_count
+                item.engagement = like_count + comment_count
+                item.metadata["view_count"] = view_count
+                item.metadata["like_count"] = like_count
+                item.metadata["comment_count"] = comment_count
+            items.extend(found_items)
+
+        status = SourceStatus.ACTIVE if items and not errors else SourceStatus.DEGRADED
         return self._create_result(items, status, errors, warnings)
 
     async def _fetch_trending(
         self,
-        youtube,
         region: str,
         market: str
     ) -> list[TrendItem]:
-        """Fetch trending videos for a region."""
+        """Fetch trending videos for a region; API errors propagate to fetch."""
         items = []
 
-        loop = asyncio.get_event_loop()
-
-        try:
+        response = _trending_cache.get(region)
+        if response is None:
             # Get trending videos (category 10 = Music)
-            request = youtube.videos().list(
+            response = await self._get(
+                "videos",
                 part="snippet,statistics",
                 chart="mostPopular",
                 regionCode=region,
                 videoCategoryId="10",  # Music
-                maxResults=25
+                maxResults=25,
+                fields=TRENDING_FIELDS
             )
-
-            response = await loop.run_in_executor(None, request.execute)
-
-            for video in response.get("items", []):
-                snippet = video.get("snippet", {})
-                stats = video.get("statistics", {})
-
-                items.append(TrendItem(
-                    id=video.get("id", ""),
-                    source=self.name,
-                    source_url=f"https://youtube.com/watch?v={video.get('id', '')}",
-                    title=snippet.get("title", ""),
-                    description=snippet.get("description", "")[:500],
-                    market=market,
-                    volume=int(stats.get("viewCount", 0)),
-                    engagement=int(stats.get("likeCount", 0)) + int(stats.get("commentCount", 0)),
-                    published_at=datetime.fromisoformat(
-                        snippet.get("publishedAt", "").replace("Z", "+00:00")
-                    ) if snippet.get("publishedAt") else None,
-                    metadata={
-                        "type": "youtube_trending",
-                        "channel_title": snippet.get("channelTitle", ""),
-                        "channel_id": snippet.get("channelId", ""),
-                        "view_count": int(stats.get("viewCount", 0)),
-                        "like_count": int(stats.get("likeCount", 0)),
-                        "comment_count": int(stats.get("commentCount", 0)),
-                        "category": "Music",
-                        "region": region,
-                    }
-                ))
-
-        except Exception as e:
-            self.logger.error("trending_fetch_error", region=region, error=str(e))
+            _trending_cache[region] = response
+
+        for video in response.get("items", []):
+            video_id = video.get("id", "")
+            snippet = video.get("snippet", {})
+            stats = video.get("statistics", {})
+            view_count = int(stats.get("viewCount", 0))
+            like_count = int(stats.get("likeCount", 0))
+            comment_count = int(stats.get("commentCount", 0))
+            # RFC 3339 in UTC ("...Z"), which fromisoformat reads directly
+            published = snippet.get("publishedAt")
+
+            items.append(TrendItem(
+                id=video_id,
+                source=self.name,
+                source_url=f"https://youtube.com/watch?v={video_id}",
+                title=snippet.get("title", ""),
+                description=snippet.get("description", "")[:500],
+                market=market,
+                volume=view_count,
+                engagement=like_count + comment_count,
+                published_at=datetime.fromisoformat(published) if published else None,
+                metadata={
+                    "type": "youtube_trending",
+                    "channel_title": snippet.get("channelTitle", ""),
+                    "channel_id": snippet.get("channelId", ""),
+                    "view_count": view_count,
+                    "like_count": like_count,
+                    "comment_count": comment_count,
+                    "category": "Music",
+                    "region": region,
+                }
+            ))
 
         return items
 
     async def _search_videos(
         self,
-        youtube,
         keyword: str,
+        published_after: Optional[str] = None,
         max_results: int = 10
     ) -> list[TrendItem]:
-        """Search for videos matching a keyword."""
-        items = []
-
-        loop = asyncio.get_event_loop()
+        """
+        Search for videos matching a keyword.
 
-        try:
-            request = youtube.search().list(
+        ``published_after`` is the RFC 3339 start of the search window;
+        it defaults to _search_published_after(). API errors propagate to
+        fetch.
+        """
+        items = []
+        if published_after is None:
+            published_after = _search_published_after()
+
+        cache_key = (keyword, max_results, published_after)
+        response = _search_cache.get(cache_key)
+        if response is None:
+            response = await self._get(
+                "search",
                 part="snippet",
                 q=keyword,
                 type="video",
                 order="viewCount",
-                publishedAfter=(datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                ) - __import__('datetime').timedelta(days=7)).isoformat(),
-                maxResults=max_results
+                publishedAfter=published_after,
+                maxResults=max_results,
+                fields=SEARCH_FIELDS
             )
+            _search_cache[cache_key] = response
+
+        for item in response.get("items", []):
+            snippet = item.get("snippet", {})
+            video_id = item.get("id", {}).get("videoId", "")
+            # RFC 3339 in UTC ("...Z"), which fromisoformat reads directly
+            published = snippet.get("publishedAt")
+
+            items.append(TrendItem(
+                id=video_id,
+                source=self.name,
+                source_url=f"https://youtube.com/watch?v={video_id}",
+                title=snippet.get("title", ""),
+                description=snippet.get("description", "")[:500],
+                published_at=datetime.fromisoformat(published) if published else None,
+                metadata={
+                    "type": "youtube_search",
+                    "search_query": keyword,
+                    "channel_title": snippet.get("channelTitle", ""),
+                    "channel_id": snippet.get("channelId", ""),
+                }
+            ))
 
-            response = await loop.run_in_executor(None, request.execute)
-
-            for item in response.get("items", []):
-                snippet = item.get("snippet", {})
-                video_id = item.get("id", {}).get("videoId", "")
-
-                items.append(TrendItem(
-                    id=video_id,
-                    source=self.name,
-                    source_url=f"https://youtube.com/watch?v={video_id}",
-                    title=snippet.get("title", ""),
-                    description=snippet.get("description", "")[:500],
-                    published_at=datetime.fromisoformat(
-                        snippet.get("publishedAt", "").replace("Z", "+00:00")
-                    ) if snippet.get("publishedAt") else None,
-                    metadata={
-                        "type": "youtube_search",
-                        "search_query": keyword,
-                        "channel_title": snippet.get("channelTitle", ""),
-                        "channel_id": snippet.get("channelId", ""),
-                    }
-                ))
+        return items
 
-        except Exception as e:
-            self.logger.warning("search_error", keyword=keyword, error=str(e))
+    async def _hydrate_videos(self, video_ids: list[str]) -> dict[str, dict]:
+        """
+        Look up statistics for videos, VIDEOS_LIST_BATCH_SIZE IDs per call.
 
-        return items
+        Returns statistics keyed by video ID; videos in a failed batch are
+        left out.
+        """
+        batches = [
+            video_ids[i:i + VIDEOS_LIST_BATCH_SIZE]
+            for i in range(0, len(video_ids), VIDEOS_LIST_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._get(
+                    "videos",
+                    part="statistics",
+                    id=",".join(batch),
+                    maxResults=VIDEOS_LIST_BATCH_SIZE,
+                    fields=VIDEO_STATS_FIELDS
+                )
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+
+        video_stats = {}
+        for response in results:
+            if isinstance(response, Exception):
+                self.logger.warning("video_stats_error", error=str(response))
+                continue
+            for video in response.get("items", []):
+                video_stats[video.get("id", "")] = video.get("statistics", {})
+        return video_stats
 
     async def health_check(self) -> bool:
         """Check if YouTube API is accessible."""
         if not self._has_credentials():
             return False
 
-        youtube = self._get_youtube()
-        if not youtube:
-            return False
-
         try:
-            loop = asyncio.get_event_loop()
-            request = youtube.videos().list(
+            response = await self._get(
+                "videos",
                 part="snippet",
                 chart="mostPopular",
                 regionCode="ZA",
-                maxResults=1
+                maxResults=1,
+                fields="items(id)"
             )
-            response = await loop.run_in_executor(None, request.execute)
             return "items" in response
 
         except Exception as e:
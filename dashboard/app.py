@@ -17,8 +17,9 @@ import yaml
 
 from auth.middleware import (
     AuthMiddleware, verify_password, create_session,
-    get_session_from_cookie, get_login_page_html, is_auth_enabled,
-    SESSION_COOKIE_NAME, SESSION_DURATION_HOURS, _session_cache
+    get_auth_password, get_session_from_cookie, get_login_page_html, is_auth_enabled,
+    SESSION_COOKIE_NAME, SESSION_DURATION_HOURS, _session_cache, expiry_timestamp,
+    purge_session_caches,
 )
 from monitoring.health import DataHealthMonitor
 from monitoring.risk_validator import RiskFactorValidator
@@ -99,12 +100,17 @@ def create_app() -> FastAPI:
     app.state.orchestrator = None
     app.state.health_monitor = None
     app.state.risk_validator = None
+    app.state.session_purger = None
 
-    # Add auth middleware
+    # Add auth middleware (skipped entirely when no password is set)
     def get_storage_from_request(request: Request):
         return request.app.state.storage
 
-    app.add_middleware(AuthMiddleware, storage_getter=get_storage_from_request)
+    # Re-read AUTH_PASSWORD here rather than trust a lookup cached at
+    # import, so a password set after import still installs the middleware
+    get_auth_password.cache_clear()
+    if is_auth_enabled():
+        app.add_middleware(AuthMiddleware, storage_getter=get_storage_from_request)
 
     @app.on_event("startup")
     async def startup():
@@ -118,11 +124,20 @@ def create_app() -> FastAPI:
         app.state.orchestrator = PipelineOrchestrator(app.state.config)
         app.state.health_monitor = DataHealthMonitor(app.state.storage)
         app.state.risk_validator = RiskFactorValidator(app.state.config)
+
+        if is_auth_enabled():
+            import asyncio
+            app.state.session_purger = asyncio.create_task(purge_session_caches())
+
         logger.info("dashboard_started")
 
     @app.on_event("shutdown")
     async def shutdown():
         """Close storage on shutdown."""
+        if app.state.session_purger:
+            app.state.session_purger.cancel()
+        if app.state.orchestrator:
+            await app.state.orchestrator.close()
         if app.state.storage:
             await app.state.storage.close()
         logger.info("dashboard_stopped")
@@ -188,7 +203,7 @@ def create_app() -> FastAPI:
             await app.state.storage.save_user_session(session)
 
             # Cache it
-            _session_cache[session_id] = {"expires_at": expires_at}
+            _session_cache.set(session_id, expiry_timestamp(expires_at))
 
             # Set cookie and redirect
             response = RedirectResponse(url=next, status_code=302)
@@ -212,8 +227,7 @@ def create_app() -> FastAPI:
         session_id = get_session_from_cookie(request)
         if session_id:
             await app.state.storage.delete_user_session(session_id)
-            if session_id in _session_cache:
-                del _session_cache[session_id]
+            _session_cache.discard(session_id)
 
         response = RedirectResponse(url="/auth/login", status_code=302)
         response.delete_cookie(SESSION_COOKIE_NAME)
@@ -700,7 +714,10 @@ def create_app() -> FastAPI:
             try:
                 logger.info("trendjack_refresh_module_start", module="style_signals")
                 style_connector = StyleSignalsConnector(config)
-                signals = await style_connector.fetch_signals(markets)
+                try:
+                    signals = await style_connector.fetch_signals(markets)
+                finally:
+                    await style_connector.aclose()
                 await state.storage.save_style_signals(signals)
 
                 await state.health_monitor.update_module_health(
@@ -821,7 +838,10 @@ def create_app() -> FastAPI:
 
                 logger.info("unified_refresh_pipeline_start", markets=market_list)
                 orchestrator = PipelineOrchestrator(app.state.config)
-                pipeline_result = await orchestrator.run_full_pipeline(markets=market_list)
+                try:
+                    pipeline_result = await orchestrator.run_full_pipeline(markets=market_list)
+                finally:
+                    await orchestrator.close()
 
                 # Save results to storage if successful
                 summaries = pipeline_result.get("summaries", [])
@@ -862,7 +882,10 @@ def create_app() -> FastAPI:
 
                 # Style signals
                 style_connector = StyleSignalsConnector(config)
-                signals = await style_connector.fetch_signals(market_list)
+                try:
+                    signals = await style_connector.fetch_signals(market_list)
+                finally:
+                    await style_connector.aclose()
                 await app.state.storage.save_style_signals(signals)
                 trendjack_result["style_signals"] = len(signals)
                 await app.state.health_monitor.update_module_health("style_signals", True, len(signals))
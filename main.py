@@ -12,6 +12,10 @@ Usage:
 
 import asyncio
 import argparse
+import atexit
+import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -19,23 +23,44 @@ from datetime import datetime
 import structlog
 import yaml
 
-# Configure logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+
+def configure_logging(debug: bool = False) -> None:
+    """
+    Configure structlog on top of stdlib logging.
+
+    Called once, after the command line is parsed. Warnings and errors are
+    shown by default, everything with --debug. Calls below the level are
+    dropped by the filtering bound logger before any processor runs.
+    Records are handed to a queue and written by a listener thread, so
+    logging never blocks the event loop on I/O; the listener is flushed
+    and stopped at exit.
+    """
+    level = logging.DEBUG if debug else logging.WARNING
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.dev.ConsoleRenderer()
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
 
 logger = structlog.get_logger()
 
@@ -99,6 +124,7 @@ async def run_pipeline():
             return 1
 
     finally:
+        await orchestrator.close()
         await storage.close()
 
     return 0
@@ -289,7 +315,10 @@ async def run_trendjack_refresh():
         logger.info("Fetching style signals...")
         try:
             style_connector = StyleSignalsConnector(config)
-            all_signals = await style_connector.fetch_signals(markets)
+            try:
+                all_signals = await style_connector.fetch_signals(markets)
+            finally:
+                await style_connector.aclose()
             await storage.save_style_signals(all_signals)
             logger.info(f"Saved {len(all_signals)} style signals")
             await health_monitor.update_module_health("style_signals", True, len(all_signals))
@@ -338,7 +367,10 @@ async def health_check():
     from pipeline import PipelineOrchestrator
 
     orchestrator = PipelineOrchestrator(config)
-    health = await orchestrator.health_check()
+    try:
+        health = await orchestrator.health_check()
+    finally:
+        await orchestrator.close()
 
     print("\n" + "="*60)
     print("CONNECTOR HEALTH CHECK")
@@ -382,6 +414,7 @@ def main():
     )
 
     args = parser.parse_args()
+    configure_logging(debug=args.debug)
 
     # Run the appropriate command
     if args.command == "run-pipeline":
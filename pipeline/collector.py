@@ -221,6 +221,13 @@ class DataCollector:
 
         return results
 
+    async def close(self):
+        """Close the connectors' HTTP sessions."""
+        await asyncio.gather(
+            *(connector.aclose() for connector in self.connectors.values()),
+            return_exceptions=True
+        )
+
     def get_connector_status(self) -> list[dict]:
         """Get status summary for all connectors."""
         return [
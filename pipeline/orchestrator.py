@@ -256,6 +256,10 @@ class PipelineOrchestrator:
             "connectors": connector_health,
         }
 
+    async def close(self):
+        """Release connector resources such as HTTP sessions."""
+        await self.collector.close()
+
     def get_status(self) -> dict:
         """Get current pipeline status."""
         return {
@@ -276,4 +280,7 @@ async def run_pipeline(config: dict) -> dict:
         Pipeline results
     """
     orchestrator = PipelineOrchestrator(config)
-    return await orchestrator.run_full_pipeline()
+    try:
+        return await orchestrator.run_full_pipeline()
+    finally:
+        await orchestrator.close()
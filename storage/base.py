@@ -5,7 +5,7 @@ Base storage interface and data models.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from enum import Enum
 import json
 
@@ -28,7 +28,7 @@ class ModuleStatus(str, Enum):
     DOWN = "down"
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtistSpike:
     """Artist search spike data."""
     id: str
@@ -65,7 +65,7 @@ class ArtistSpike:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CultureSearch:
     """Rising culture search term."""
     id: str
@@ -75,7 +75,7 @@ class CultureSearch:
     rise_percentage: float
     volume: int = 0
     is_cross_market: bool = False
-    markets_present: List[str] = field(default_factory=list)
+    markets_present: Tuple[str, ...] = ()
     risk_level: str = "low"  # auto high for politics
     collected_at: datetime = field(default_factory=datetime.utcnow)
 
@@ -94,7 +94,7 @@ class CultureSearch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleSignal:
     """Streetwear/fashion signal from RSS."""
     id: str
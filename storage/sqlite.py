@@ -719,7 +719,7 @@ class SQLiteStorage(BaseStorage):
                 rise_percentage=row_dict["rise_percentage"],
                 volume=row_dict.get("volume", 0),
                 is_cross_market=bool(row_dict.get("is_cross_market", 0)),
-                markets_present=json.loads(row_dict["markets_present"]) if row_dict.get("markets_present") else [],
+                markets_present=tuple(json.loads(row_dict["markets_present"])) if row_dict.get("markets_present") else (),
                 risk_level=row_dict.get("risk_level", "low"),
                 collected_at=datetime.fromisoformat(row_dict["collected_at"]) if row_dict.get("collected_at") else datetime.utcnow(),
             ))
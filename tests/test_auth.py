@@ -0,0 +1,117 @@
+"""Tests for authentication middleware helpers."""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from auth.middleware import AuthMiddleware, SessionCache, get_auth_password, is_public_path
+
+
+class TestSessionCache:
+    """Tests for the bounded session cache."""
+
+    def test_get_returns_unexpired_session(self):
+        """Test that live sessions are returned from the cache."""
+        cache = SessionCache()
+        cache.set("abc", time.time() + 3600)
+
+        assert cache.get("abc") is not None
+
+    def test_get_drops_expired_session(self):
+        """Test that expired sessions are removed on lookup."""
+        cache = SessionCache()
+        cache.set("abc", time.time() - 1)
+
+        assert cache.get("abc") is None
+        assert "abc" not in cache
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = SessionCache(max_size=2)
+        expires_at = time.time() + 3600
+        cache.set("a", expires_at)
+        cache.set("b", expires_at)
+        cache.get("a")
+        cache.set("c", expires_at)
+
+        assert len(cache) == 2
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_sweep_removes_leading_expired(self):
+        """Test that the periodic sweep drops expired entries."""
+        cache = SessionCache(sweep_interval=1000)
+        cache.set("old", time.time() - 1)
+        cache.set("new", time.time() + 3600)
+
+        assert cache.sweep() == 1
+        assert "old" not in cache
+        assert "new" in cache
+
+    def test_purge_expired_removes_all_expired(self):
+        """Test that a full purge drops expired entries behind live ones."""
+        cache = SessionCache(sweep_interval=1000)
+        cache.set("live", time.time() + 3600)
+        cache.set("old", time.time() - 1)
+
+        assert cache.sweep() == 0
+        assert cache.purge_expired() == 1
+        assert "old" not in cache
+        assert "live" in cache
+
+
+class TestPublicPaths:
+    """Tests for public path matching."""
+
+    def test_public_paths(self):
+        """Test that health, auth and static paths are public."""
+        assert is_public_path("/health")
+        assert is_public_path("/api/health")
+        assert is_public_path("/auth/login")
+        assert is_public_path("/static")
+        assert is_public_path("/static/app.css")
+
+    def test_protected_paths(self):
+        """Test that dashboard and API paths require auth."""
+        assert not is_public_path("/")
+        assert not is_public_path("/api/trends")
+        assert not is_public_path("/healthcheck")
+        assert not is_public_path("/auth/sessions")
+
+
+class TestSessionValidation:
+    """Tests for AuthMiddleware session validation."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_is_negative_cached(self):
+        """Test that repeated lookups of an unknown session skip storage."""
+        storage = MagicMock()
+        storage.get_user_session = AsyncMock(return_value=None)
+        middleware = AuthMiddleware(MagicMock(), storage_getter=lambda request: storage)
+
+        assert await middleware._validate_session(MagicMock(), "unknown-session") is False
+        assert await middleware._validate_session(MagicMock(), "unknown-session") is False
+        assert storage.get_user_session.await_count == 1
+
+
+class TestCreateApp:
+    """Tests for auth setup in the dashboard app factory."""
+
+    @pytest.mark.filterwarnings("ignore:`regex` has been deprecated")
+    def test_password_set_after_import_enables_auth(self, monkeypatch):
+        """Test that create_app sees an AUTH_PASSWORD set after the first lookup."""
+        from dashboard.app import create_app
+
+        monkeypatch.delenv("AUTH_PASSWORD", raising=False)
+        get_auth_password.cache_clear()
+        assert get_auth_password() is None
+
+        monkeypatch.setenv("AUTH_PASSWORD", "secret")
+        try:
+            app = create_app()
+        finally:
+            monkeypatch.delenv("AUTH_PASSWORD")
+            get_auth_password.cache_clear()
+
+        assert AuthMiddleware in [middleware.cls for middleware in app.user_middleware]
@@ -1,12 +1,16 @@
 """Tests for data source connectors."""
 
+import json
+import time
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from connectors.base import BaseConnector, TrendItem, ConnectorResult, SourceStatus
 from connectors.news_rss import NewsRSSConnector
 from connectors.reddit import RedditConnector
+from connectors.twitter import TwitterConnector
 from connectors.wikipedia import WikipediaConnector
+from connectors.youtube import YouTubeConnector
 
 
 @pytest.fixture
@@ -44,6 +48,41 @@ def wikipedia_config():
     }
 
 
+@pytest.fixture
+def twitter_config(monkeypatch):
+    """Sample Twitter connector config, with a bearer token set."""
+    monkeypatch.setenv("TWITTER_BEARER_TOKEN", "test-token")
+    return {
+        "enabled": True,
+        "priority": 3,
+        "reliability": 0.7,
+    }
+
+
+@pytest.fixture
+def youtube_config(monkeypatch):
+    """Sample YouTube connector config, with an API key set and empty caches."""
+    from connectors import youtube
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    with patch.dict(youtube._trending_cache, clear=True), \
+            patch.dict(youtube._search_cache, clear=True):
+        yield {
+            "enabled": True,
+            "priority": 2,
+            "reliability": 0.9,
+        }
+
+
+def mock_response(status=200, body=None, headers=None):
+    """Build a mocked aiohttp response usable as an async context manager."""
+    response = MagicMock(status=status, headers=headers or {})
+    response.read = AsyncMock(return_value=json.dumps(body or {}).encode())
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
 class TestTrendItem:
     """Tests for TrendItem data class."""
 
@@ -56,8 +95,7 @@ class TestTrendItem:
             source_url="https://example.com",
         )
 
-        assert item.id != ""
-        assert len(item.id) == 16
+        assert item.id == "1bcff0b54d065af6"
 
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -77,6 +115,16 @@ class TestTrendItem:
         assert d["title"] == "Test Title"
         assert d["market"] == "ZA"
         assert d["volume"] == 1000
+        assert d["published_at"] is None
+        assert d["collected_at"] == item.collected_at.isoformat()
+
+    def test_uses_slots(self):
+        """Test that items carry no per-instance __dict__."""
+        item = TrendItem(id="test123", source="test_source")
+        result = ConnectorResult(source="test", status=SourceStatus.ACTIVE)
+
+        assert not hasattr(item, "__dict__")
+        assert not hasattr(result, "__dict__")
 
 
 class TestConnectorResult:
@@ -130,7 +178,7 @@ class TestNewsRSSConnector:
         """Test market detection for Nigeria."""
         connector = NewsRSSConnector(rss_config)
 
-        text = "Breaking news from Lagos, Nigeria today"
+        text = "Breaking news from Lagos, Nigeria today".lower()
         market = connector._detect_market(text, ["ZA", "NG", "KE"])
 
         assert market == "NG"
@@ -139,7 +187,7 @@ class TestNewsRSSConnector:
         """Test market detection for South Africa."""
         connector = NewsRSSConnector(rss_config)
 
-        text = "Johannesburg residents react to new policy"
+        text = "Johannesburg residents react to new policy".lower()
         market = connector._detect_market(text, ["ZA", "NG", "KE"])
 
         assert market == "ZA"
@@ -148,11 +196,65 @@ class TestNewsRSSConnector:
         """Test market detection when no market matches."""
         connector = NewsRSSConnector(rss_config)
 
-        text = "Generic news about something"
+        text = "Generic news about something".lower()
         market = connector._detect_market(text, ["ZA", "NG", "KE"])
 
         assert market is None
 
+    @pytest.mark.asyncio
+    async def test_fetch_feed_revalidates_with_etag(self, rss_config):
+        """Test that an unchanged feed is served from cache on 304."""
+        from connectors import base
+
+        rss = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel>'
+            b"<item><title>Lagos news</title><link>https://example.com/1</link></item>"
+            b"</channel></rss>"
+        )
+        responses = [
+            MagicMock(status=200, headers={"ETag": '"v1"'}, read=AsyncMock(return_value=rss)),
+            MagicMock(status=304, headers={}),
+        ]
+        for response in responses:
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(side_effect=responses)
+
+        connector = NewsRSSConnector(rss_config)
+        feed = rss_config["feeds"][0]
+        with patch.dict(base._feed_cache, clear=True):
+            first = await connector._fetch_feed(session, feed, set(), ["NG"])
+            second = await connector._fetch_feed(session, feed, set(), ["NG"])
+
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert [item.title for item in second] == [item.title for item in first] == ["Lagos news"]
+        assert first[0].id == "0eaff508937d0d32"
+
+    @pytest.mark.asyncio
+    async def test_health_check_uses_head(self, rss_config):
+        """Test that feeds are checked with HEAD, falling back to GET on 405."""
+        rss_config["feeds"].append({"name": "No HEAD", "url": "https://example.com/nohead"})
+
+        def response(status):
+            mock = MagicMock(status=status)
+            mock.__aenter__ = AsyncMock(return_value=mock)
+            mock.__aexit__ = AsyncMock(return_value=None)
+            return mock
+
+        session = MagicMock()
+        session.head = MagicMock(
+            side_effect=lambda url, **kwargs: response(405 if url.endswith("nohead") else 200)
+        )
+        session.get = MagicMock(return_value=response(200))
+
+        connector = NewsRSSConnector(rss_config)
+        with patch.object(connector, "_get_session", return_value=session):
+            assert await connector.health_check() is True
+
+        assert session.head.call_count == 2
+        session.get.assert_called_once()
+
 
 class TestRedditConnector:
     """Tests for RedditConnector."""
@@ -167,25 +269,79 @@ class TestRedditConnector:
 
     @pytest.mark.asyncio
     async def test_health_check_mocked(self, reddit_config):
-        """Test health check with mocked response."""
+        """Test that concurrent health checks share one listing request."""
+        import asyncio
+
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(200))
+        connector = RedditConnector(reddit_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            results = await asyncio.gather(connector.health_check(), connector.health_check())
+
+        assert results == [True, True]
+        session.get.assert_called_once()
+        assert session.get.call_args.args[0] == "https://www.reddit.com/r/Africa/hot.json?limit=1"
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_error_status(self, reddit_config):
+        """Test that a non-200 listing response is unhealthy."""
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(503))
         connector = RedditConnector(reddit_config)
 
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
+        with patch.object(connector, "_get_session", return_value=session):
+            assert await connector.health_check() is False
 
-            mock_get = AsyncMock(return_value=mock_response)
-            mock_session_instance = MagicMock()
-            mock_session_instance.get = mock_get
-            mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_session.return_value = mock_session_instance
+    @pytest.mark.asyncio
+    async def test_json_api_keeps_subreddit_order(self, reddit_config):
+        """Test that concurrently fetched subreddits keep config order."""
+        def listing(url, **kwargs):
+            sub_name = url.split("/r/")[1].split("/")[0]
+            post = {"id": sub_name, "title": f"{sub_name} news", "selftext": ""}
+            response = MagicMock(status=200)
+            body = {"data": {"children": [{"data": post}]}}
+            response.read = AsyncMock(return_value=json.dumps(body).encode())
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            return response
+
+        connector = RedditConnector(reddit_config)
+        session = MagicMock()
+        session.get = MagicMock(side_effect=listing)
 
-            result = await connector.health_check()
-            # Note: This may fail due to async context manager complexity
-            # In real tests, use proper async fixtures
+        with patch("connectors.reddit.JSON_API_REQUEST_INTERVAL_SECONDS", 0), \
+                patch.object(connector, "_get_session", return_value=session):
+            items = await connector._fetch_with_json_api([])
+
+        assert [item.id for item in items] == ["Africa", "Nigeria"]
+
+    @pytest.mark.asyncio
+    async def test_praw_scans_subreddits_one_at_a_time(self, reddit_config):
+        """Test that the shared PRAW client is never used by two threads."""
+        active = []
+        overlaps = []
+
+        def hot(sub_name):
+            def listing(limit):
+                if active:
+                    overlaps.append(sub_name)
+                active.append(sub_name)
+                time.sleep(0.01)
+                active.remove(sub_name)
+                return []
+            return listing
+
+        reddit = MagicMock()
+        reddit.subreddit.side_effect = lambda sub_name: MagicMock(hot=hot(sub_name))
+        connector = RedditConnector(reddit_config)
+
+        with patch.dict("sys.modules", {"praw": MagicMock()}), \
+                patch.object(connector, "_get_praw", return_value=reddit):
+            await connector._fetch_with_praw([])
+
+        assert reddit.subreddit.call_count == 2
+        assert overlaps == []
 
 
 class TestWikipediaConnector:
@@ -199,6 +355,326 @@ class TestWikipediaConnector:
         assert connector.requires_auth is False
         assert connector.pageview_threshold == 10000
 
+    def test_build_pageview_items_ragged_series(self, wikipedia_config):
+        """Test pageview metrics for series of different lengths."""
+        connector = WikipediaConnector(wikipedia_config)
+
+        items = connector._build_pageview_items(
+            ["Spiking Page", "Quiet Page", "Single Day"],
+            [[100, 100, 300], [10, 10, 10, 10], [20000]],
+        )
+
+        assert [item.title for item in items] == ["Spiking Page", "Single Day"]
+        spiking, single = items
+        assert spiking.volume == 500
+        assert spiking.velocity == 2.0
+        assert spiking.metadata["average_daily"] == 167
+        assert spiking.metadata["latest_daily"] == 300
+        assert spiking.metadata["spike_detected"] is True
+        assert single.velocity == 0.0
+
+    @pytest.mark.asyncio
+    async def test_fetch_pageviews_batch(self, wikipedia_config):
+        """Test batched pageviews with normalized, missing and unanswered titles."""
+        body = {
+            "query": {
+                "normalized": [{"from": "burna Boy", "to": "Burna Boy"}],
+                "pages": [
+                    {"title": "Burna Boy", "pageviews": {"2025-01-02": 20, "2025-01-01": 10}},
+                    {"title": "No Such Page", "missing": True},
+                    {"title": "Later Batch"},
+                ],
+            }
+        }
+        response = MagicMock(status=200, read=AsyncMock(return_value=json.dumps(body).encode()))
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(return_value=response)
+
+        connector = WikipediaConnector(wikipedia_config)
+        views = await connector._fetch_pageviews_batch(
+            session, ["burna Boy", "No Such Page", "Later Batch"]
+        )
+
+        assert views == {"burna Boy": [10, 20], "No Such Page": None}
+        assert session.get.call_args.kwargs["params"]["titles"] == "burna Boy|No Such Page|Later Batch"
+
+
+class TestTwitterConnector:
+    """Tests for TwitterConnector."""
+
+    @pytest.mark.asyncio
+    async def test_search_keyword_builds_items(self, twitter_config):
+        """Test that a page of tweets becomes TrendItems."""
+        body = {
+            "data": [
+                {
+                    "id": "1",
+                    "text": "Amapiano is taking over Lagos",
+                    "lang": "en",
+                    "created_at": "2025-01-05T09:30:00.000Z",
+                    "public_metrics": {
+                        "like_count": 10,
+                        "retweet_count": 3,
+                        "reply_count": 2,
+                        "impression_count": 500,
+                    },
+                },
+                {"id": "2", "text": "No metrics here"},
+            ]
+        }
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(body=body))
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            items = await connector._search_keyword("amapiano")
+
+        assert [item.id for item in items] == ["1", "2"]
+        assert items[0].engagement == 15
+        assert items[0].volume == 500
+        assert items[0].source_url == "https://twitter.com/i/web/status/1"
+        assert items[0].metadata["search_query"] == "amapiano"
+        assert items[1].engagement == 0
+        assert items[1].published_at is None
+
+        params = session.get.call_args.kwargs["params"]
+        assert params["query"] == "amapiano -is:retweet lang:en"
+        assert session.get.call_args.kwargs["headers"] == {"Authorization": "Bearer test-token"}
+
+    @pytest.mark.asyncio
+    async def test_search_keyword_parses_created_at(self, twitter_config):
+        """Test that created_at is parsed as a UTC datetime."""
+        from datetime import datetime, timezone
+
+        body = {"data": [{"id": "1", "text": "hi", "created_at": "2025-01-05T09:30:00.000Z"}]}
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(body=body))
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            items = await connector._search_keyword("hi")
+
+        assert items[0].published_at == datetime(2025, 1, 5, 9, 30, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_search_recent_retries_after_rate_limit(self, twitter_config):
+        """Test that a 429 waits for the window to reset and retries."""
+        reset_at = int(time.time()) + 5
+        session = MagicMock()
+        session.get = MagicMock(side_effect=[
+            mock_response(429, headers={"x-rate-limit-reset": str(reset_at)}),
+            mock_response(body={"data": [{"id": "1", "text": "hi"}]}),
+        ])
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session), \
+                patch("connectors.twitter.asyncio.sleep", AsyncMock()) as sleep:
+            body = await connector._search_recent("hi")
+
+        assert body["data"][0]["id"] == "1"
+        assert session.get.call_count == 2
+        sleep.assert_awaited_once()
+        assert 0 < sleep.await_args.args[0] <= 6
+
+    @pytest.mark.asyncio
+    async def test_search_recent_caps_rate_limit_retries(self, twitter_config):
+        """Test that repeated 429s fail after MAX_RATE_LIMIT_RETRIES waits."""
+        reset_at = str(int(time.time()))
+        session = MagicMock()
+        session.get = MagicMock(side_effect=lambda *args, **kwargs: mock_response(
+            429, headers={"x-rate-limit-reset": reset_at}
+        ))
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session), \
+                patch("connectors.twitter.asyncio.sleep", AsyncMock()) as sleep:
+            with pytest.raises(RuntimeError, match="rate limited"):
+                await connector._search_recent("hi")
+
+        assert session.get.call_count == 3
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_recent_does_not_wait_out_long_windows(self, twitter_config):
+        """Test that a reset beyond MAX_RATE_LIMIT_WAIT_SECONDS fails at once."""
+        reset_at = str(int(time.time()) + 900)
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(
+            429, headers={"x-rate-limit-reset": reset_at}
+        ))
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session), \
+                patch("connectors.twitter.asyncio.sleep", AsyncMock()) as sleep:
+            with pytest.raises(RuntimeError, match="rate limited"):
+                await connector._search_recent("hi")
+
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_search_keyword_falls_back_to_tweepy(self, twitter_config):
+        """Test that a connection failure retries the search through tweepy."""
+        import aiohttp
+
+        tweet = MagicMock(data={"id": "7", "text": "Accra nights", "lang": "en"})
+        tweepy = MagicMock()
+        tweepy.Client.return_value.search_recent_tweets.return_value = MagicMock(data=[tweet])
+        connector = TwitterConnector(twitter_config)
+
+        with patch.dict("sys.modules", {"tweepy": tweepy}), \
+                patch.object(connector, "_search_recent",
+                             AsyncMock(side_effect=aiohttp.ClientConnectionError("down"))):
+            items = await connector._search_keyword("accra")
+
+        assert [item.id for item in items] == ["7"]
+        assert tweepy.Client.call_args.kwargs["wait_on_rate_limit"] is False
+        search = tweepy.Client.return_value.search_recent_tweets
+        assert search.call_args.kwargs["query"] == "accra -is:retweet lang:en"
+
+    @pytest.mark.asyncio
+    async def test_health_check_treats_rate_limit_as_reachable(self, twitter_config):
+        """Test that the health check reports a 429 as healthy without waiting."""
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(
+            429, headers={"x-rate-limit-reset": str(int(time.time()) + 900)}
+        ))
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session), \
+                patch("connectors.twitter.asyncio.sleep", AsyncMock()) as sleep:
+            assert await connector.health_check() is True
+
+        assert session.get.call_count == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_search_recent_raises_on_error_status(self, twitter_config):
+        """Test that a non-200, non-429 response raises."""
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(401))
+        connector = TwitterConnector(twitter_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            with pytest.raises(RuntimeError, match="401"):
+                await connector._search_recent("hi")
+
+
+class TestYouTubeConnector:
+    """Tests for YouTubeConnector."""
+
+    @pytest.mark.asyncio
+    async def test_get_sends_key_and_fields(self, youtube_config):
+        """Test that Data API requests carry the key and partial-response fields."""
+        from connectors.youtube import API_BASE_URL, TRENDING_FIELDS
+
+        body = {"items": [{"id": "v1", "snippet": {"title": "Hit"}, "statistics": {}}]}
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(body=body))
+        connector = YouTubeConnector(youtube_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            items = await connector._fetch_trending("ZA", "ZA")
+
+        assert [item.id for item in items] == ["v1"]
+        assert session.get.call_args.args[0] == f"{API_BASE_URL}/videos"
+        params = session.get.call_args.kwargs["params"]
+        assert params["key"] == "test-key"
+        assert params["fields"] == TRENDING_FIELDS
+        assert params["chart"] == "mostPopular"
+        assert params["regionCode"] == "ZA"
+        assert params["videoCategoryId"] == "10"
+
+    @pytest.mark.asyncio
+    async def test_search_sends_fields_and_window(self, youtube_config):
+        """Test that searches request only the snippet fields in the search window."""
+        from connectors.youtube import API_BASE_URL, SEARCH_FIELDS
+
+        body = {"items": [{"id": {"videoId": "v2"}, "snippet": {"title": "Amapiano mix"}}]}
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(body=body))
+        connector = YouTubeConnector(youtube_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            items = await connector._search_videos("amapiano", "2025-01-01T00:00:00+00:00")
+
+        assert [item.id for item in items] == ["v2"]
+        assert session.get.call_args.args[0] == f"{API_BASE_URL}/search"
+        params = session.get.call_args.kwargs["params"]
+        assert params["key"] == "test-key"
+        assert params["fields"] == SEARCH_FIELDS
+        assert params["q"] == "amapiano"
+        assert params["publishedAfter"] == "2025-01-01T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_get_raises_on_error_status(self, youtube_config):
+        """Test that a non-200 response raises RuntimeError."""
+        session = MagicMock()
+        session.get = MagicMock(return_value=mock_response(403))
+        connector = YouTubeConnector(youtube_config)
+
+        with patch.object(connector, "_get_session", return_value=session):
+            with pytest.raises(RuntimeError, match="403"):
+                await connector._get("videos", part="snippet")
+
+    @pytest.mark.asyncio
+    async def test_hydrate_videos_batches_ids(self, youtube_config):
+        """Test that stats are looked up 50 IDs per call and merged."""
+        video_ids = [f"v{i}" for i in range(120)]
+
+        async def get(resource, **params):
+            ids = params["id"].split(",")
+            return {"items": [{"id": v, "statistics": {"viewCount": v[1:]}} for v in ids]}
+
+        connector = YouTubeConnector(youtube_config)
+        with patch.object(connector, "_get", side_effect=get) as mock_get:
+            stats = await connector._hydrate_videos(video_ids)
+
+        assert mock_get.await_count == 3
+        assert [len(c.kwargs["id"].split(",")) for c in mock_get.await_args_list] == [50, 50, 20]
+        assert len(stats) == 120
+        assert stats["v119"] == {"viewCount": "119"}
+
+    @pytest.mark.asyncio
+    async def test_hydrate_videos_skips_failed_batch(self, youtube_config):
+        """Test that a failed batch leaves only its own videos out."""
+        video_ids = [f"v{i}" for i in range(60)]
+
+        async def get(resource, **params):
+            ids = params["id"].split(",")
+            if "v0" in ids:
+                raise RuntimeError("YouTube API returned 500")
+            return {"items": [{"id": v, "statistics": {"viewCount": "1"}} for v in ids]}
+
+        connector = YouTubeConnector(youtube_config)
+        with patch.object(connector, "_get", side_effect=get):
+            stats = await connector._hydrate_videos(video_ids)
+
+        assert sorted(stats) == sorted(f"v{i}" for i in range(50, 60))
+
+    @pytest.mark.asyncio
+    async def test_fetch_reports_failed_calls(self, youtube_config):
+        """Test that failed trending and search calls are errors and degrade status."""
+        trending = {"items": [{"id": "v1", "snippet": {"title": "Hit"}, "statistics": {}}]}
+
+        async def get(resource, **params):
+            if params.get("regionCode") == "NG":
+                raise RuntimeError("YouTube API returned 403")
+            if resource == "search":
+                raise RuntimeError("YouTube API returned 500")
+            return trending
+
+        connector = YouTubeConnector(youtube_config)
+        with patch.object(connector, "_get", side_effect=get):
+            result = await connector.fetch(["ZA", "NG"], ["amapiano"])
+
+        assert [item.id for item in result.items] == ["v1"]
+        assert result.status == SourceStatus.DEGRADED
+        assert len(result.errors) == 2
+        assert "NG" in result.errors[0]
+        assert "amapiano" in result.errors[1]
+
 
 class TestBaseConnector:
     """Tests for BaseConnector abstract class."""
@@ -210,3 +686,35 @@ class TestBaseConnector:
         assert connector._normalize_market("za") == "ZA"
         assert connector._normalize_market(" NG ") == "NG"
         assert connector._normalize_market("ke") == "KE"
+
+    @pytest.mark.asyncio
+    async def test_coalesce_shares_inflight_call(self, rss_config):
+        """Test that concurrent calls with the same key run once."""
+        import asyncio
+
+        connector = NewsRSSConnector(rss_config)
+        calls = []
+
+        async def load(url):
+            calls.append(url)
+            await asyncio.sleep(0)
+            return url.upper()
+
+        results = await asyncio.gather(
+            connector._coalesce("a", load, "a"),
+            connector._coalesce("a", load, "a"),
+            connector._coalesce("b", load, "b"),
+        )
+
+        assert results == ["A", "A", "B"]
+        assert calls == ["a", "b"]
+        assert connector._inflight == {}
+
+    def test_prepare_keywords_drops_implied(self, rss_config):
+        """Test that keywords containing a shorter keyword are dropped."""
+        connector = NewsRSSConnector(rss_config)
+
+        keywords = connector._prepare_keywords(["Amapiano", "amapiano festival", "Burna Boy"])
+
+        assert sorted(keywords) == ["amapiano", "burna boy"]
+        assert connector._prepare_keywords(None) == ()
@@ -129,6 +129,14 @@ class TestDataCleaner:
         assert len(cleaned) == 1
         assert cleaned[0].title == "This is a valid title"
 
+    def test_content_hash_is_stable(self, sample_config):
+        """Test that dedup keys keep their stored SHA-256 format."""
+        cleaner = DataCleaner(sample_config)
+
+        item = TrendItem(id="1", source="test", title="  Test Item ")
+
+        assert cleaner._compute_content_hash(item) == "2150e074b10aebcc"
+
     def test_normalize_text(self, sample_config):
         """Test text normalization."""
         cleaner = DataCleaner(sample_config)
@@ -57,6 +57,11 @@ class TestArtistSpike:
         assert data["spike_score"] == 60.0
         assert "collected_at" in data
 
+    def test_spike_id_is_stable(self):
+        from connectors.artist_spikes import generate_spike_id
+
+        assert generate_spike_id("Burna Boy", "NG", "24h") == "7aea82c5874bf9fc"
+
 
 class TestCultureSearch:
     """Tests for CultureSearch data model."""
@@ -501,10 +506,27 @@ class TestSpikeScoreCalculation:
         score = calculate_spike_score(100, 100)
         assert score == 0
 
+    def test_vectorised_scores_match_scalar(self):
+        from connectors.artist_spikes import calculate_spike_score, calculate_spike_scores
+
+        currents = [100, 150, 300, 100, 0, 40]
+        baselines = [0, 100, 100, 100, 0, 80]
+
+        scores = calculate_spike_scores(currents, baselines)
+
+        assert scores.tolist() == [
+            calculate_spike_score(c, b) for c, b in zip(currents, baselines)
+        ]
+
 
 class TestCultureSearchClassification:
     """Tests for culture search classification."""
 
+    def test_search_id_is_stable(self):
+        from connectors.culture_search import generate_search_id
+
+        assert generate_search_id("Amapiano", "ZA") == "0a5a8e0335201996"
+
     def test_sensitivity_classification(self):
         from connectors.culture_search import classify_sensitivity
 
@@ -514,6 +536,13 @@ class TestCultureSearchClassification:
         assert classify_sensitivity("president speech") == "politics"
         assert classify_sensitivity("viral challenge tiktok") == "meme"
 
+    def test_sensitivity_classification_priority(self):
+        from connectors.culture_search import classify_sensitivity
+
+        # Earlier tags win even when a later tag matches earlier in the term
+        assert classify_sensitivity("president album") == "music"
+        assert classify_sensitivity("hello world") == "celebrity"
+
     def test_risk_level_determination(self):
         from connectors.culture_search import determine_risk_level
 
@@ -523,6 +552,23 @@ class TestCultureSearchClassification:
         assert determine_risk_level("celebrity drama", "celebrity") == "medium"  # drama is medium risk
         assert determine_risk_level("artist beef", "music") == "medium"  # beef is medium risk
 
+    @pytest.mark.asyncio
+    async def test_categories_fetched_when_trending_fails(self):
+        import pandas as pd
+        from connectors.culture_search import CultureSearchConnector
+
+        pytrends = MagicMock()
+        pytrends.trending_searches.side_effect = RuntimeError("404")
+        pytrends.related_queries.return_value = {
+            "amapiano": {"rising": pd.DataFrame({"query": ["new amapiano song"], "value": [250]})}
+        }
+        connector = CultureSearchConnector({})
+
+        with patch("connectors.culture_search.PYTRENDS_REQUEST_INTERVAL_SECONDS", 0):
+            searches = await connector._fetch_market_culture(pytrends, "ZA")
+
+        assert [s.term for s in searches] == ["new amapiano song"]
+
 
 class TestStyleSignalDetection:
     """Tests for style signal detection."""
@@ -553,6 +599,114 @@ class TestStyleSignalDetection:
         tags = detect_spotify_tags(text)
         assert "youth_culture" in tags or "streetwear" in tags
 
+    def test_parse_feed_entries_matches_feedparser(self):
+        import feedparser
+        from connectors.style_signals import extract_summary, parse_feed_entries
+
+        content = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel>'
+            b"<item><title>Lagos &amp; Accra</title><link>https://example.com/1</link>"
+            b"<description><![CDATA[<p>Fashion <b>week</b></p><script>x()</script>]]></description>"
+            b"<pubDate>Tue, 10 Jun 2025 04:00:00 +0200</pubDate></item>"
+            b"</channel></rss>"
+        )
+
+        entry = parse_feed_entries(content)[0]
+        expected = feedparser.parse(content).entries[0]
+
+        assert entry["title"] == expected["title"] == "Lagos & Accra"
+        assert entry["link"] == expected["link"]
+        assert extract_summary(entry) == extract_summary(expected) == "Fashion week"
+        assert entry["published_parsed"] == expected["published_parsed"]
+
+    def test_parse_feed_entries_decodes_html_entities(self):
+        import feedparser
+        from connectors.style_signals import extract_summary, parse_feed_entries
+
+        content = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel>'
+            b"<item><title>Burna Boy&rsquo;s new drop &mdash; merch</title>"
+            b"<link>https://example.com/1</link>"
+            b"<description>&lt;p&gt;Lagos&amp;rsquo; &lt;a href=\"x\"&gt;streetwear&lt;/a&gt;"
+            b"&amp;nbsp;scene&lt;/p&gt;</description></item>"
+            b"</channel></rss>"
+        )
+
+        entry = parse_feed_entries(content)[0]
+        expected = feedparser.parse(content).entries[0]
+
+        assert entry["title"] == expected["title"] == "Burna Boy\u2019s new drop \u2014 merch"
+        assert extract_summary(entry) == extract_summary(expected) == "Lagos\u2019 streetwear scene"
+
+    def test_extract_summary_decodes_entities_in_well_formed_feed(self):
+        from connectors.style_signals import extract_summary, parse_feed_entries
+
+        content = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel>'
+            b"<item><title>Accra</title><link>https://example.com/1</link>"
+            b"<description><![CDATA[<p>Accra&rsquo;s&nbsp;<b>thrift</b> scene</p>]]></description>"
+            b"</item></channel></rss>"
+        )
+
+        entry = parse_feed_entries(content)[0]
+
+        assert extract_summary(entry) == "Accra\u2019s thrift scene"
+
+    @pytest.mark.asyncio
+    async def test_load_feed_entries_revalidates_with_etag(self):
+        from connectors import base
+        from connectors.style_signals import StyleSignalsConnector, parse_feed_entries
+
+        rss = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel>'
+            b"<item><title>Lagos drop</title><link>https://example.com/1</link></item>"
+            b"</channel></rss>"
+        )
+        responses = [
+            MagicMock(status=200, headers={"ETag": '"v1"'}, read=AsyncMock(return_value=rss)),
+            MagicMock(status=304, headers={}),
+        ]
+        for response in responses:
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(side_effect=responses)
+
+        connector = StyleSignalsConnector({})
+        url = "https://example.com/feed"
+        with patch.dict(base._feed_cache, clear=True):
+            first = await connector._load_feed_entries(session, "test", url, parse_feed_entries)
+            second = await connector._load_feed_entries(session, "test", url, parse_feed_entries)
+
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert second is first
+        assert first[0]["title"] == "Lagos drop"
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_stops_after_stale_entries(self):
+        from connectors.style_signals import StyleSignalsConnector
+
+        now = datetime.utcnow()
+        fresh = now.utctimetuple()
+        stale = (now - timedelta(days=30)).utctimetuple()
+        entries = [
+            {"title": "one", "link": "https://example.com/1", "published_parsed": fresh},
+            {"title": "two", "link": "https://example.com/2", "published_parsed": stale},
+            {"title": "three", "link": "https://example.com/3", "published_parsed": fresh},
+            {"title": "four", "link": "https://example.com/4", "published_parsed": stale},
+            {"title": "five", "link": "https://example.com/5", "published_parsed": stale},
+            {"title": "six", "link": "https://example.com/6", "published_parsed": fresh},
+        ]
+        connector = StyleSignalsConnector({})
+        feed_info = {"url": "https://example.com/feed", "name": "Test", "region": "global"}
+
+        with patch.object(connector, "_load_feed_entries", AsyncMock(return_value=entries)):
+            signals = await connector._fetch_feed(
+                MagicMock(), "test", feed_info, now - timedelta(days=7)
+            )
+
+        assert [s.headline for s in signals] == ["one", "three"]
+
 
 class TestRiskFactorValidator:
     """Tests for RiskFactorValidator."""